@@ -0,0 +1,107 @@
+"""
+Stateless authentication for the JWTs issued by LoginSerializer.
+
+Tokens are verified locally with SIMPLE_JWT['SIGNING_KEY']. The user they name is resolved
+together with its Profile through an in-process TTL/LRU principal cache, so a cache hit
+costs no query. Saving or deleting a User or Profile evicts the affected entries in this
+process; other processes pick the change up within PRINCIPAL_CACHE_TTL seconds.
+"""
+from collections import OrderedDict
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+from authentication.models import User, Profile
+from authentication.permissions import get_role_bits
+import copy
+import jwt
+import threading
+import time
+
+class PrincipalCache:
+    """
+    Thread-safe LRU of user id -> (expiry, User with profileName loaded).
+    """
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self.entries[user_id]
+                return None
+            self.entries.move_to_end(user_id)
+            # Each request gets its own copy so per-request state never leaks between threads
+            return copy.copy(entry[1])
+
+    def put(self, user):
+        with self.lock:
+            self.entries[user.pk] = (time.monotonic() + self.ttl, user)
+            self.entries.move_to_end(user.pk)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+    def invalidate_profile(self, profile_id):
+        with self.lock:
+            for user_id in [user_id for user_id, (_, user) in self.entries.items() if user.profileName_id == profile_id]:
+                del self.entries[user_id]
+
+principal_cache = PrincipalCache(
+    getattr(settings, 'PRINCIPAL_CACHE_SIZE', 10000),
+    getattr(settings, 'PRINCIPAL_CACHE_TTL', 60),
+)
+
+def evict_user(sender, instance, **kwargs):
+    principal_cache.invalidate(instance.pk)
+
+def evict_profile(sender, instance, **kwargs):
+    principal_cache.invalidate_profile(instance.pk)
+
+post_save.connect(evict_user, sender=User, dispatch_uid='principal-cache-user-save')
+post_delete.connect(evict_user, sender=User, dispatch_uid='principal-cache-user-delete')
+post_save.connect(evict_profile, sender=Profile, dispatch_uid='principal-cache-profile-save')
+post_delete.connect(evict_profile, sender=Profile, dispatch_uid='principal-cache-profile-delete')
+
+class JWTAuthentication(BaseAuthentication):
+    """
+    Authorization: Bearer <token> -> authentication.models.User.
+    """
+    keyword = 'Bearer'
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed("Invalid authorization header")
+        try:
+            payload = jwt.decode(auth[1], settings.SIMPLE_JWT['SIGNING_KEY'], algorithms=['HS256'])
+        except jwt.ExpiredSignatureError:
+            raise AuthenticationFailed("Token has expired")
+        except jwt.InvalidTokenError:
+            raise AuthenticationFailed("Invalid token")
+
+        user_id = payload.get('user_id')
+        user = principal_cache.get(user_id)
+        if user is None:
+            user = User.objects.select_related('profileName').filter(id=user_id).first()
+            if user is None:
+                raise AuthenticationFailed("User not found")
+            get_role_bits(user)  # Cached entries carry their resolved role
+            principal_cache.put(user)
+        if not user.isActive:
+            raise AuthenticationFailed("Account is deactivated")
+        return user, payload
+
+    def authenticate_header(self, request):
+        return self.keyword
@@ -0,0 +1,308 @@
+"""
+Bulk user import for partner onboarding.
+
+Rows are read as a stream from CSV or NDJSON and processed in batches of USER_IMPORT_BATCH_SIZE.
+Each batch is validated in memory, checked against existing users with one query, has its
+passwords hashed on a process pool (one make_password per user, so throughput scales with
+cores) and is written with one bulk_create for User and one for Login. While one batch is
+written the next one is already hashing. Rows that fail are collected in a per-row error report
+instead of aborting the import. bulk_create sends no post_save, so the change log entries for
+the new users are recorded explicitly; Login is not a tracked model.
+
+The admin endpoint never imports inside the request: create_import_job() saves the upload,
+records a UserImportJob and starts `manage.py import_users --job <id>` as a separate process,
+which owns the hashing pool and stores the report on the job. Only one job is PENDING or
+RUNNING at a time, since each one already uses every core. A running job touches its
+lastModifiedDate after every batch; one silent for USER_IMPORT_JOB_TIMEOUT seconds (its process
+was killed, or never started) is marked FAILED before the next upload is accepted.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import transaction, IntegrityError
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import serializers
+from authentication.models import User, Login, Profile, UserImportJob
+from changelog.signals import record_bulk_create
+from core.utils import allocate_unique_ids
+import csv
+import django
+import json
+import logging
+import os
+import subprocess
+import sys
+
+logger = logging.getLogger('authentication')
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+ACTIVE_STATUSES = ('PENDING', 'RUNNING')
+IMPORT_LOCK_KEY = 'user-import-lock'
+
+class ImportInProgress(Exception):
+    pass
+
+class UserImportRowSerializer(serializers.Serializer):
+    # Uniqueness is checked per batch in bulk, not by per-row validators
+    firstName = serializers.CharField(max_length=50)
+    lastName = serializers.CharField(max_length=50)
+    email = serializers.EmailField(max_length=254)
+    username = serializers.CharField(max_length=50, required=False, allow_blank=True)
+    profileName = serializers.ChoiceField(choices=Profile.ROLES, required=False, default='USER')
+    password = serializers.CharField()
+
+def detect_format(filename, default='csv'):
+    extension = os.path.splitext(filename or '')[1].lower().lstrip('.')
+    if extension in ('ndjson', 'jsonl'):
+        return 'ndjson'
+    return 'csv' if extension == 'csv' else default
+
+def read_rows(stream, fmt):
+    """
+    Yield (row_number, data, error) from a text stream without loading it whole.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for number, row in enumerate(reader, start=1):
+            yield number, {key: value for key, value in row.items() if key}, None
+    elif fmt == 'ndjson':
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield number, None, f"Invalid JSON: {e}"
+                continue
+            if isinstance(row, dict):
+                yield number, row, None
+            else:
+                yield number, None, "Expected a JSON object"
+    else:
+        raise ValueError(f"Unsupported import format '{fmt}', expected one of {', '.join(IMPORT_FORMATS)}")
+
+class UserImporter:
+    def __init__(self, batch_size=None, workers=None, heartbeat=None):
+        self.heartbeat = heartbeat
+        self.batch_size = batch_size or getattr(settings, 'USER_IMPORT_BATCH_SIZE', 1000)
+        self.workers = workers or getattr(settings, 'USER_IMPORT_WORKERS', None) or os.cpu_count() or 1
+        self.profiles = {}
+        self.seen_emails = set()
+        self.seen_usernames = set()
+        self.report = {'created': 0, 'failed': 0, 'errors': []}
+
+    def fail(self, number, errors):
+        self.report['failed'] += 1
+        self.report['errors'].append({'row': number, 'errors': errors})
+
+    def run(self, rows):
+        """
+        Import an iterable of (row_number, data, error) and return the report.
+        """
+        # Child processes only need the password hashers, which django.setup makes available
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=django.setup) as pool:
+            pending = None
+            for batch in self.batches(rows):
+                submitted = (batch, pool.map(make_password, [row['password'] for _, row in batch], chunksize=max(1, len(batch) // (self.workers * 4))))
+                if pending:
+                    self.write(*pending)
+                pending = submitted
+            if pending:
+                self.write(*pending)
+        self.report['errors'].sort(key=lambda error: error['row'])
+        logger.info(f"User import finished: {self.report['created']} created, {self.report['failed']} failed")
+        return self.report
+
+    def batches(self, rows):
+        batch = []
+        for number, data, error in rows:
+            if error:
+                self.fail(number, {'row': [error]})
+                continue
+            row = self.validate(number, data)
+            if row is not None:
+                batch.append((number, row))
+            if len(batch) >= self.batch_size:
+                yield self.exclude_existing(batch)
+                batch = []
+        if batch:
+            yield self.exclude_existing(batch)
+
+    def validate(self, number, data):
+        serializer = UserImportRowSerializer(data=data)
+        if not serializer.is_valid():
+            self.fail(number, serializer.errors)
+            return None
+        row = dict(serializer.validated_data)
+        row['email'] = row['email'].lower()
+        row['username'] = row.get('username') or row['email'].split('@')[0]
+        # Duplicates within the file are caught here, against the database in exclude_existing
+        if row['email'] in self.seen_emails:
+            self.fail(number, {'email': ["Duplicate email in import"]})
+            return None
+        if row['username'] in self.seen_usernames:
+            self.fail(number, {'username': ["Duplicate username in import"]})
+            return None
+        self.seen_emails.add(row['email'])
+        self.seen_usernames.add(row['username'])
+        return row
+
+    def exclude_existing(self, batch):
+        emails = [row['email'] for _, row in batch]
+        usernames = [row['username'] for _, row in batch]
+        taken_emails, taken_usernames = set(), set()
+        for email, username in User.objects.filter(Q(email__in=emails) | Q(username__in=usernames)).values_list('email', 'username'):
+            taken_emails.add(email.lower())
+            taken_usernames.add(username)
+        kept = []
+        for number, row in batch:
+            if row['email'] in taken_emails:
+                self.fail(number, {'email': ["A user with this email already exists"]})
+            elif row['username'] in taken_usernames:
+                self.fail(number, {'username': ["A user with this username already exists"]})
+            else:
+                kept.append((number, row))
+        return kept
+
+    def get_profile(self, name):
+        if name not in self.profiles:
+            self.profiles[name], _ = Profile.objects.get_or_create(name=name)
+        return self.profiles[name]
+
+    def build(self, batch, hashes):
+        users = []
+        logins = []
+        for (number, row), user_id, login_id, password_hash in zip(batch, allocate_unique_ids("USR", len(batch)), allocate_unique_ids("LGN", len(batch)), hashes):
+            # bulk_create skips User.save, so the derived name is set here
+            users.append(User(
+                id=user_id,
+                firstName=row['firstName'],
+                lastName=row['lastName'],
+                name=f"{row['firstName']} {row['lastName'].upper()}",
+                email=row['email'],
+                username=row['username'],
+                profileName=self.get_profile(row['profileName']),
+            ))
+            logins.append(Login(id=login_id, userId_id=user_id, passwordHash=password_hash))
+        return users, logins
+
+    def write(self, batch, hashes):
+        if not batch:
+            return
+        users, logins = self.build(batch, list(hashes))
+        try:
+            with transaction.atomic():
+                User.objects.bulk_create(users)
+                Login.objects.bulk_create(logins)
+                record_bulk_create(User, users)
+            self.report['created'] += len(users)
+        except IntegrityError:
+            # A concurrent writer took an email or username; isolate the failing rows one at a time
+            for (number, _), user, login in zip(batch, users, logins):
+                try:
+                    with transaction.atomic():
+                        User.objects.bulk_create([user])
+                        Login.objects.bulk_create([login])
+                        record_bulk_create(User, [user])
+                    self.report['created'] += 1
+                except IntegrityError as e:
+                    self.fail(number, {'row': [str(e)]})
+        if self.heartbeat:
+            self.heartbeat()
+
+def import_users(stream, fmt, **options):
+    """
+    Import users from a CSV or NDJSON text stream and return the per-row report.
+    """
+    return UserImporter(**options).run(read_rows(stream, fmt))
+
+def fail_import_job(job_id, message, statuses=ACTIVE_STATUSES):
+    return UserImportJob.objects.filter(pk=job_id, status__in=statuses).update(
+        status='FAILED', finishedDate=timezone.now(), lastModifiedDate=timezone.now(), errors=[{'row': None, 'errors': {'job': [message]}}]
+    )
+
+def reap_stale_import_jobs():
+    """
+    Mark PENDING or RUNNING jobs without a heartbeat for USER_IMPORT_JOB_TIMEOUT seconds as FAILED.
+    """
+    timeout = timedelta(seconds=getattr(settings, 'USER_IMPORT_JOB_TIMEOUT', 600))
+    stale = UserImportJob.objects.filter(status__in=ACTIVE_STATUSES, lastModifiedDate__lt=timezone.now() - timeout)
+    for job_id, path in stale.values_list('id', 'filePath'):
+        if fail_import_job(job_id, "Import stopped responding"):
+            logger.warning(f"User import {job_id} marked as failed after {timeout.total_seconds():.0f}s without progress")
+            if path and os.path.exists(path):
+                os.remove(path)
+
+def create_import_job(upload, fmt):
+    """
+    Save an uploaded file and import it out of the request. Returns the PENDING job, or raises
+    ImportInProgress while another job is pending or running.
+    """
+    # The lock makes the check and the insert one step across web workers
+    if not cache.add(IMPORT_LOCK_KEY, True, 60):
+        raise ImportInProgress("Another import is being started")
+    try:
+        reap_stale_import_jobs()
+        active = UserImportJob.objects.filter(status__in=ACTIVE_STATUSES).values_list('id', flat=True).first()
+        if active:
+            raise ImportInProgress(f"Import {active} is still in progress")
+        job = save_import_job(upload, fmt)
+    finally:
+        cache.delete(IMPORT_LOCK_KEY)
+    transaction.on_commit(lambda: launch_import_job(job))
+    return job
+
+def save_import_job(upload, fmt):
+    job = UserImportJob(fileName=upload.name, format=fmt)
+    upload_dir = getattr(settings, 'USER_IMPORT_UPLOAD_DIR', os.path.join(settings.BASE_DIR, 'imports'))
+    job.filePath = os.path.join(upload_dir, f"{job.id}.{fmt}")
+    os.makedirs(upload_dir, exist_ok=True)
+    with open(job.filePath, 'wb') as destination:
+        for chunk in upload.chunks():
+            destination.write(chunk)
+    job.save()
+    return job
+
+def launch_import_job(job):
+    # A fresh interpreter rather than a fork of the web worker and its threads
+    command = [sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'import_users', '--job', job.id]
+    try:
+        subprocess.Popen(command, start_new_session=True, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        logger.error(f"Could not start user import {job.id}: {e}")
+        fail_import_job(job.pk, str(e))
+
+def run_import_job(job_id, **options):
+    """
+    Import the file saved for a PENDING job and store the report on it.
+    """
+    # Claimed with a conditional UPDATE so a job never runs twice
+    now = timezone.now()
+    if not UserImportJob.objects.filter(pk=job_id, status='PENDING').update(status='RUNNING', startedDate=now, lastModifiedDate=now):
+        raise ValueError(f"Import job {job_id} does not exist or is not pending")
+    job = UserImportJob.objects.get(pk=job_id)
+    path = job.filePath
+
+    def heartbeat():
+        # A job reaped as stale stops at its next batch instead of finishing unseen
+        if not UserImportJob.objects.filter(pk=job_id, status='RUNNING').update(lastModifiedDate=timezone.now()):
+            raise RuntimeError(f"Import job {job_id} was marked as failed")
+
+    try:
+        with open(path, newline='', encoding='utf-8') as stream:
+            report = UserImporter(heartbeat=heartbeat, **options).run(read_rows(stream, job.format))
+    except Exception as e:
+        logger.exception(f"User import {job_id} failed")
+        fail_import_job(job_id, str(e), statuses=('RUNNING',))
+        raise
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    UserImportJob.objects.filter(pk=job_id, status='RUNNING').update(
+        status='DONE', created=report['created'], failed=report['failed'], errors=report['errors'],
+        finishedDate=timezone.now(), lastModifiedDate=timezone.now()
+    )
+    return report
@@ -0,0 +1,54 @@
+"""
+Bounded password verification for the login path.
+
+PBKDF2 releases the GIL, so hashing runs on a small thread pool sized to the CPU count
+instead of on every request thread at once. At most LOGIN_HASH_WORKERS + LOGIN_HASH_QUEUE_LIMIT
+verifications are admitted; beyond that, or when a verification does not finish within
+LOGIN_HASH_TIMEOUT seconds, PasswordVerificationUnavailable is raised so the caller can
+shed the login with a 503 rather than tie up a worker.
+"""
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+import os
+import secrets
+import threading
+
+class PasswordVerificationUnavailable(Exception):
+    pass
+
+_workers = getattr(settings, 'LOGIN_HASH_WORKERS', None) or os.cpu_count() or 1
+_executor = ThreadPoolExecutor(max_workers=_workers, thread_name_prefix='login-hash')
+_slots = threading.BoundedSemaphore(_workers + getattr(settings, 'LOGIN_HASH_QUEUE_LIMIT', 32))
+
+@lru_cache(maxsize=None)
+def _dummy_hash():
+    # Verified against when the account does not exist, so both paths cost one hash
+    return make_password(secrets.token_hex(16))
+
+def _release(future):
+    _slots.release()
+
+def _run(function, *args):
+    if not _slots.acquire(blocking=False):
+        raise PasswordVerificationUnavailable("Too many concurrent logins")
+    future = _executor.submit(function, *args)
+    future.add_done_callback(_release)
+    try:
+        return future.result(timeout=getattr(settings, 'LOGIN_HASH_TIMEOUT', 5))
+    except TimeoutError:
+        future.cancel()
+        raise PasswordVerificationUnavailable("Password hashing timed out")
+
+def verify_password(password, encoded):
+    """
+    check_password on the hashing pool. encoded=None still costs one hash.
+    """
+    return _run(check_password, password, encoded or _dummy_hash()) and encoded is not None
+
+def hash_password(password):
+    """
+    make_password on the hashing pool.
+    """
+    return _run(make_password, password)
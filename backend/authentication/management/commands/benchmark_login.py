@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from authentication.hashing import PasswordVerificationUnavailable
+from authentication.models import User, Login, Profile
+from authentication.serializers import LoginSerializer
+from django.contrib.auth.hashers import make_password
+import secrets
+import time
+
+class Command(BaseCommand):
+    help = "Measure login throughput and latency through LoginSerializer at several concurrency levels"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16, 64], help="Concurrent login threads per run")
+        parser.add_argument('--logins', type=int, default=200, help="Logins per run")
+
+    def login(self, credentials):
+        start = time.perf_counter()
+        try:
+            outcome = 'ok' if LoginSerializer(data=credentials).is_valid() else 'rejected'
+        except PasswordVerificationUnavailable:
+            outcome = 'shed'
+        finally:
+            close_old_connections()
+        return outcome, time.perf_counter() - start
+
+    def handle(self, *args, **options):
+        name = f"bench{secrets.token_hex(4)}"
+        password = secrets.token_urlsafe(12)
+        profile, _ = Profile.objects.get_or_create(name='USER')
+        user = User.objects.create(firstName='Bench', lastName='Mark', email=f"{name}@example.invalid", username=name, profileName=profile)
+        Login.objects.create(userId=user, passwordHash=make_password(password))
+        credentials = {'email_or_username': name, 'password': password}
+        try:
+            self.stdout.write(f"{'threads':>8}{'logins/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'shed':>6}")
+            for threads in options['concurrency']:
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=threads) as pool:
+                    results = list(pool.map(self.login, [credentials] * options['logins']))
+                elapsed = time.perf_counter() - start
+                latencies = sorted(latency for outcome, latency in results if outcome != 'shed')
+                shed = sum(outcome == 'shed' for outcome, _ in results)
+                p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+                p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000 if latencies else 0
+                self.stdout.write(f"{threads:>8}{(len(results) - shed) / elapsed:>10.1f}{p50:>9.1f}{p99:>9.1f}{shed:>6}")
+        finally:
+            Login.objects.filter(userId=user).delete()
+            user.delete()
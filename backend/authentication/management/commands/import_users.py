@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand, CommandError
+from authentication.bulk_import import import_users, run_import_job, detect_format, IMPORT_FORMATS
+import json
+import sys
+
+class Command(BaseCommand):
+    help = "Bulk-create users from a CSV or NDJSON file (firstName, lastName, email, username, profileName, password)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', help="File to import, or - for stdin")
+        parser.add_argument('--job', help="Run a pending UserImportJob created by the admin endpoint instead")
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help="Defaults to the file extension, csv for stdin")
+        parser.add_argument('--batch-size', type=int)
+        parser.add_argument('--workers', type=int, help="Hashing processes; defaults to the CPU count")
+        parser.add_argument('--report', help="Write the per-row errors to this file as NDJSON")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if options['job']:
+            try:
+                report = run_import_job(options['job'], batch_size=options['batch_size'], workers=options['workers'])
+            except ValueError as e:
+                raise CommandError(str(e))
+        elif path:
+            fmt = options['format'] or detect_format(None if path == '-' else path)
+            try:
+                stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+            except OSError as e:
+                raise CommandError(f"Cannot open {path}: {e}")
+            with stream:
+                report = import_users(stream, fmt, batch_size=options['batch_size'], workers=options['workers'])
+        else:
+            raise CommandError("Give a file to import or --job")
+        if options['report']:
+            with open(options['report'], 'w', encoding='utf-8') as out:
+                for error in report['errors']:
+                    out.write(json.dumps(error) + '\n')
+        else:
+            for error in report['errors']:
+                self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+        self.stdout.write(f"Created {report['created']} users, {report['failed']} rows failed")
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from authentication.models import Login
+from datetime import timedelta
+
+class Command(BaseCommand):
+    help = "Report Login rows still on the legacy token1/token2 credentials, optionally deactivating stale ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--deactivate-older-than', type=int, metavar='DAYS', help="Deactivate legacy rows not modified for DAYS days; those users must reset their password")
+
+    def handle(self, *args, **options):
+        legacy = Login.objects.filter(passwordHash='', isActive=True)
+        self.stdout.write(f"{legacy.count()} active logins still use legacy credentials, {Login.objects.exclude(passwordHash='').count()} upgraded")
+        days = options['deactivate_older_than']
+        if days is not None:
+            deactivated = legacy.filter(lastModifiedDate__lt=timezone.now() - timedelta(days=days)).update(isActive=False)
+            self.stdout.write(f"Deactivated {deactivated} legacy logins older than {days} days")
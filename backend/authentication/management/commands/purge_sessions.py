@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from authentication.models import Session
+import logging
+import time
+
+logger = logging.getLogger('authentication')
+
+class Command(BaseCommand):
+    help = "Delete expired sessions in bounded batches; meant to run periodically from cron"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=getattr(settings, 'SESSION_PURGE_BATCH_SIZE', 1000))
+        parser.add_argument('--pause', type=float, default=0.1, help="Seconds to sleep between batches")
+        parser.add_argument('--max-batches', type=int, help="Stop after this many batches")
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        cutoff = timezone.now()
+        # A range scan on the expiresAt index; each batch is its own short DELETE keyed on
+        # primary keys. Deactivated sessions go once they expire, so no unindexed isActive pass
+        expired = Session.objects.filter(expiresAt__lte=cutoff).order_by('expiresAt')
+        total = batches = 0
+        while options['max_batches'] is None or batches < options['max_batches']:
+            ids = list(expired.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                break
+            total += Session.objects.filter(id__in=ids).delete()[0]
+            batches += 1
+            if len(ids) < batch_size:
+                break
+            time.sleep(options['pause'])
+        logger.info(f"Purged {total} sessions in {batches} batches")
+        self.stdout.write(f"Purged {total} sessions in {batches} batches")
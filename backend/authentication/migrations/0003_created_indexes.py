@@ -0,0 +1,29 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_alter_login_id_alter_profile_id_alter_session_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='login',
+            index=models.Index(fields=['createdDate', 'id'], name='login_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='profile',
+            index=models.Index(fields=['createdDate', 'id'], name='profile_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['createdDate', 'id'], name='session_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['createdDate', 'id'], name='user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:58
+
+import core.utils
+from django.db import migrations, models
+import functools
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='login',
+            name='id',
+            field=models.CharField(default=functools.partial(core.utils.generate_unique_id, *('LGN',), **{}), editable=False, max_length=20, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='profile',
+            name='id',
+            field=models.CharField(default=functools.partial(core.utils.generate_unique_id, *('PRF',), **{}), editable=False, max_length=20, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='session',
+            name='id',
+            field=models.CharField(default=functools.partial(core.utils.generate_unique_id, *('SES',), **{}), editable=False, max_length=20, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='id',
+            field=models.CharField(default=functools.partial(core.utils.generate_unique_id, *('USR',), **{}), editable=False, max_length=20, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.20 on 2026-10-18 05:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0004_callable_id_defaults'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='login',
+            name='passwordHash',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='login',
+            name='token1',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AlterField(
+            model_name='login',
+            name='token2',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-18 05:13
+
+import authentication.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_login_password_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='session',
+            name='expiresAt',
+            field=models.DateTimeField(default=authentication.models.default_session_expiry),
+        ),
+        migrations.AddIndex(
+            model_name='session',
+            index=models.Index(fields=['expiresAt'], name='session_expires_idx'),
+        ),
+    ]
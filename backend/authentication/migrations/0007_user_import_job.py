@@ -0,0 +1,39 @@
+# Generated by Django 4.2.20 on 2026-10-18 05:36
+
+import core.utils
+from django.db import migrations, models
+import django.db.models.deletion
+import functools
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0006_session_expiry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserImportJob',
+            fields=[
+                ('id', models.CharField(default=functools.partial(core.utils.generate_unique_id, *('IMP',), **{}), editable=False, max_length=20, primary_key=True, serialize=False)),
+                ('fileName', models.CharField(max_length=255)),
+                ('filePath', models.CharField(blank=True, max_length=500)),
+                ('format', models.CharField(max_length=10)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('startedDate', models.DateTimeField(blank=True, null=True)),
+                ('finishedDate', models.DateTimeField(blank=True, null=True)),
+                ('createdDate', models.DateTimeField(auto_now_add=True)),
+                ('lastModifiedDate', models.DateTimeField(auto_now=True)),
+                ('createdById', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='created_import_jobs', to='authentication.user')),
+                ('lastModifiedById', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='modified_import_jobs', to='authentication.user')),
+            ],
+            options={
+                'db_table': 'UserImportJob',
+                'indexes': [models.Index(fields=['createdDate', 'id'], name='userimportjob_created_idx')],
+            },
+        ),
+    ]
@@ -1,7 +1,11 @@
-from django.db import models, transaction
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from datetime import timedelta
 from django.contrib.auth.hashers import make_password
 from django.core.validators import EmailValidator
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from django.db import IntegrityError
 
 class Profile(models.Model):
@@ -16,7 +20,7 @@ class Profile(models.Model):
     id = models.CharField(
         primary_key=True,
         max_length=20,
-        default=generate_unique_id('PRF'),
+        default=unique_id_default("PRF"),
         editable=False
     )
     name = models.CharField(max_length=20, choices=ROLES, default='USER')
@@ -25,13 +29,17 @@ class Profile(models.Model):
     createdById = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, related_name='created_profiles')
     lastModifiedById = models.ForeignKey('User', on_delete=models.SET_NULL, null=True, related_name='modified_profiles')
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'Profile'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='profile_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.id:
-            with transaction.atomic():
-                self.id = generate_unique_id("PRF", Profile)
+            self.id = generate_unique_id("PRF")
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -41,7 +49,7 @@ class User(models.Model):
     id = models.CharField(
         primary_key=True,
         max_length=20,
-        default=generate_unique_id('USR'),
+        default=unique_id_default("USR"),
         editable=False
     )
     firstName = models.CharField(max_length=50)
@@ -56,16 +64,24 @@ class User(models.Model):
     lastModifiedById = models.ForeignKey('self', on_delete=models.SET_NULL, null=True, related_name='modified_users')
     isActive = models.BooleanField(default=True)
 
+    # Request principal interface expected by DRF permissions and django_currentuser
+    is_authenticated = True
+    is_anonymous = False
+
+    objects = AuditManager()
+
     class Meta:
         db_table = 'User'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='user_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.id:
-            with transaction.atomic():
-                self.id = generate_unique_id("USR", User)
-                if not self.username:
-                    self.username = self.email.split('@')[0]
-                self.name = f"{self.firstName} {self.lastName.upper()}"
+            self.id = generate_unique_id("USR")
+            if not self.username:
+                self.username = self.email.split('@')[0]
+            self.name = f"{self.firstName} {self.lastName.upper()}"
         else:
             self.name = f"{self.firstName} {self.lastName.upper()}"
         super().save(*args, **kwargs)
@@ -77,53 +93,113 @@ class Login(models.Model):
     id = models.CharField(
         primary_key=True,
         max_length=20,
-        default=generate_unique_id('LGN'),
+        default=unique_id_default("LGN"),
         editable=False
     )
     userId = models.ForeignKey(User, on_delete=models.CASCADE, related_name='logins')
-    token1 = models.CharField(max_length=255)  # Hashed email + password
-    token2 = models.CharField(max_length=255)  # Hashed username + password
+    passwordHash = models.CharField(max_length=255, blank=True, default='')  # Salted hash of the password alone
+    # Legacy credentials, cleared once the row is upgraded to passwordHash on a successful login
+    token1 = models.CharField(max_length=255, blank=True, default='')  # Hashed email + password
+    token2 = models.CharField(max_length=255, blank=True, default='')  # Hashed username + password
     createdDate = models.DateTimeField(auto_now_add=True)
     lastModifiedDate = models.DateTimeField(auto_now=True)
     createdById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_logins')
     lastModifiedById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='modified_logins')
     isActive = models.BooleanField(default=True)
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'Login'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='login_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.id:
-            with transaction.atomic():
-                self.id = generate_unique_id("LGN", Login)
+            self.id = generate_unique_id("LGN")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Login for {self.userId.username}"
 
+def default_session_expiry():
+    return timezone.now() + timedelta(seconds=getattr(settings, 'SESSION_CODE_TTL', 900))
+
 class Session(models.Model):
     id = models.CharField(
         primary_key=True,
         max_length=20,
-        default=generate_unique_id('SES'),
+        default=unique_id_default("SES"),
         editable=False
     )
     code = models.CharField(max_length=50, unique=True)
     action = models.CharField(max_length=100)
+    expiresAt = models.DateTimeField(default=default_session_expiry)
     createdDate = models.DateTimeField(auto_now_add=True)
     lastModifiedDate = models.DateTimeField(auto_now=True)
     createdById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_sessions')
     lastModifiedById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='modified_sessions')
     isActive = models.BooleanField(default=True)
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'Session'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='session_created_idx'),
+            models.Index(fields=['expiresAt'], name='session_expires_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self.id:
+            self.id = generate_unique_id("SES")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"Session {self.code} - {self.action}"
+
+
+class UserImportJob(models.Model):
+    STATUSES = (
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('DONE', 'Done'),
+        ('FAILED', 'Failed'),
+    )
+
+    id = models.CharField(
+        primary_key=True,
+        max_length=20,
+        default=unique_id_default("IMP"),
+        editable=False
+    )
+    fileName = models.CharField(max_length=255)
+    filePath = models.CharField(max_length=500, blank=True)  # Saved upload, removed once imported
+    format = models.CharField(max_length=10)
+    status = models.CharField(max_length=10, choices=STATUSES, default='PENDING')
+    created = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)  # Per-row report: [{'row': n, 'errors': {...}}]
+    startedDate = models.DateTimeField(null=True, blank=True)
+    finishedDate = models.DateTimeField(null=True, blank=True)
+    createdDate = models.DateTimeField(auto_now_add=True)
+    lastModifiedDate = models.DateTimeField(auto_now=True)  # Heartbeat while RUNNING, touched after every batch
+    createdById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='created_import_jobs')
+    lastModifiedById = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='modified_import_jobs')
+
+    objects = AuditManager()
+
+    class Meta:
+        db_table = 'UserImportJob'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='userimportjob_created_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.id:
-            with transaction.atomic():
-                self.id = generate_unique_id("SES", Session)
+            self.id = generate_unique_id("IMP")
         super().save(*args, **kwargs)
 
     def __str__(self):
-        return f"Session {self.code} - {self.action}"
\ No newline at end of file
+        return f"User import {self.id} ({self.status})"
@@ -1,22 +1,49 @@
 from rest_framework.permissions import BasePermission
 from authentication.models import Profile
 
-class IsSuperAdmin(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.profileName.name == "SUPER-ADMIN"
+# One bit per Profile role
+ROLE_BITS = {role: 1 << index for index, (role, _) in enumerate(reversed(Profile.ROLES))}
 
-class IsAdmin(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.profileName.name in ["SUPER-ADMIN", "ADMIN"]
+def get_role_bits(user):
+    """
+    Role bit of an authenticated user, 0 otherwise. Resolved once and memoized on the user
+    object, which the principal cache hands out with its profile already loaded.
+    """
+    if not getattr(user, 'is_authenticated', False):
+        return 0
+    bits = user.__dict__.get('_role_bits')
+    if bits is None:
+        profile = user.profileName
+        bits = user._role_bits = ROLE_BITS.get(profile.name, 0) if profile else 0
+    return bits
 
-class IsModerator(BasePermission):
-    def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.profileName.name in ["SUPER-ADMIN", "ADMIN", "MODERATOR"]
+class RolePermission(BasePermission):
+    """
+    Grants access to authenticated users whose role is in `roles`; one AND per check.
+    """
+    roles = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.mask = sum(ROLE_BITS[role] for role in cls.roles)
 
-class IsUser(BasePermission):
     def has_permission(self, request, view):
-        return request.user.is_authenticated and request.user.profileName.name in ["SUPER-ADMIN", "ADMIN", "MODERATOR", "USER"]
+        return bool(get_role_bits(request.user) & self.mask)
+
+class IsSuperAdmin(RolePermission):
+    roles = ("SUPER-ADMIN",)
+
+class IsAdmin(RolePermission):
+    roles = ("SUPER-ADMIN", "ADMIN")
+
+class IsModerator(RolePermission):
+    roles = ("SUPER-ADMIN", "ADMIN", "MODERATOR")
+
+class IsUser(RolePermission):
+    roles = ("SUPER-ADMIN", "ADMIN", "MODERATOR", "USER")
+
+class IsGuest(RolePermission):
+    roles = ("GUEST",)
 
-class IsGuest(BasePermission):
     def has_permission(self, request, view):
-        return not request.user.is_authenticated or (request.user.is_authenticated and request.user.profileName.name == "GUEST")
\ No newline at end of file
+        return not request.user.is_authenticated or super().has_permission(request, view)
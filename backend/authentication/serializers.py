@@ -1,12 +1,18 @@
 from rest_framework import serializers
-from authentication.models import User, Login, Profile, Session
-from django.contrib.auth.hashers import make_password, check_password
+from authentication.models import User, Login, Profile, Session, UserImportJob
+from django.contrib.auth.hashers import make_password
+from authentication.hashing import verify_password, hash_password
 import jwt
 from django.conf import settings
 from datetime import datetime, timedelta
-import random
+from django.db import transaction, IntegrityError
+import secrets
 import string
 
+SESSION_CODE_ALPHABET = string.ascii_uppercase + string.digits
+SESSION_CODE_LENGTH = 6
+SESSION_CODE_ATTEMPTS = 5
+
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True)
 
@@ -29,11 +35,7 @@ class UserSerializer(serializers.ModelSerializer):
         )
         user.save()
         # Create Login entry
-        Login.objects.create(
-            userId=user,
-            token1=make_password(validated_data['email'] + password),
-            token2=make_password(user.username + password)
-        )
+        Login.objects.create(userId=user, passwordHash=make_password(password))
         return user
 
 class LoginSerializer(serializers.Serializer):
@@ -44,48 +46,60 @@ class LoginSerializer(serializers.Serializer):
         email_or_username = data.get('email_or_username')
         password = data.get('password')
 
-        try:
-            if '@' in email_or_username:
-                user = User.objects.get(email=email_or_username)
-                login = Login.objects.filter(userId=user, isActive=True).first()
-                if not login or not check_password(email_or_username + password, login.token1):
-                    raise serializers.ValidationError("Invalid credentials")
-            else:
-                user = User.objects.get(username=email_or_username)
-                login = Login.objects.filter(userId=user, isActive=True).first()
-                if not login or not check_password(email_or_username + password, login.token2):
-                    raise serializers.ValidationError("Invalid credentials")
+        # User, login and profile in one query
+        lookup = 'userId__email' if '@' in email_or_username else 'userId__username'
+        login = Login.objects.select_related('userId__profileName').filter(
+            **{lookup: email_or_username}, isActive=True
+        ).first()
+        if login is None or login.passwordHash:
+            if not verify_password(password, login.passwordHash if login else None):
+                raise serializers.ValidationError("Invalid credentials")
+        else:
+            # Legacy row: check the identifier-specific token, then move it to a single hash
+            if not verify_password(email_or_username + password, login.token1 if '@' in email_or_username else login.token2):
+                raise serializers.ValidationError("Invalid credentials")
+            login.passwordHash, login.token1, login.token2 = hash_password(password), '', ''
+            login.save(update_fields=['passwordHash', 'token1', 'token2', 'lastModifiedDate'])
 
-            if not user.isActive:
-                raise serializers.ValidationError("Account is deactivated")
+        user = login.userId
+        if not user.isActive:
+            raise serializers.ValidationError("Account is deactivated")
 
-            jwt_token = jwt.encode({
-                'user_id': user.id,
-                'exp': datetime.utcnow() + timedelta(hours=24),
-                'iat': datetime.utcnow()
-            }, settings.SIMPLE_JWT['SIGNING_KEY'], algorithm='HS256')
+        jwt_token = jwt.encode({
+            'user_id': user.id,
+            'exp': datetime.utcnow() + timedelta(hours=24),
+            'iat': datetime.utcnow()
+        }, settings.SIMPLE_JWT['SIGNING_KEY'], algorithm='HS256')
 
-            return {'user': user, 'token': jwt_token}
-        except User.DoesNotExist:
-            raise serializers.ValidationError("Invalid credentials")
+        return {'user': user, 'token': jwt_token}
 
 class SessionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Session
-        fields = ['id', 'code', 'action', 'isActive', 'createdDate']
-        read_only_fields = ['id', 'code', 'createdDate']
+        fields = ['id', 'code', 'action', 'isActive', 'createdDate', 'expiresAt']
+        read_only_fields = ['id', 'code', 'createdDate', 'expiresAt']
 
     def create(self, validated_data):
-        while True:
-            code = ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-            if not Session.objects.filter(code=code).exists():
-                break
-        session = Session(code=code, **validated_data)
-        session.save()
-        return session
+        # The unique index arbitrates collisions: insert, and draw a new code only if it is taken
+        for _ in range(SESSION_CODE_ATTEMPTS):
+            code = ''.join(secrets.choice(SESSION_CODE_ALPHABET) for _ in range(SESSION_CODE_LENGTH))
+            session = Session(code=code, **validated_data)
+            try:
+                with transaction.atomic():
+                    session.save()
+                return session
+            except IntegrityError:
+                continue
+        raise serializers.ValidationError("Could not allocate a session code, please retry")
 
 class ProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = Profile
         fields = ['id', 'name', 'createdDate', 'lastModifiedDate', 'createdById', 'lastModifiedById']
-        read_only_fields = ['id', 'createdDate', 'lastModifiedDate']
\ No newline at end of file
+        read_only_fields = ['id', 'createdDate', 'lastModifiedDate']
+
+class UserImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = UserImportJob
+        fields = ['id', 'fileName', 'format', 'status', 'created', 'failed', 'errors', 'startedDate', 'finishedDate', 'createdDate']
+        read_only_fields = fields
@@ -1,10 +1,12 @@
 from django.urls import path
-from authentication.views import RegisterView, LoginView, SessionView, ProfileListCreateView, ProfileDetailView
+from authentication.views import RegisterView, LoginView, SessionView, UserImportView, UserImportJobDetailView, ProfileListCreateView, ProfileDetailView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('login/', LoginView.as_view(), name='login'),
     path('session/', SessionView.as_view(), name='session'),
+    path('users/import/', UserImportView.as_view(), name='user-import'),
+    path('users/import/<str:job_id>/', UserImportJobDetailView.as_view(), name='user-import-job'),
     path('profiles/', ProfileListCreateView.as_view(), name='profile-list-create'),
     path('profiles/<str:profile_id>/', ProfileDetailView.as_view(), name='profile-detail'),
 ]
\ No newline at end of file
@@ -1,10 +1,13 @@
 from rest_framework.views import APIView
 from rest_framework import status
 from rest_framework.permissions import AllowAny
-from rest_framework.authentication import TokenAuthentication
+from authentication.authentication import JWTAuthentication
 from authentication.permissions import IsSuperAdmin, IsAdmin, IsModerator, IsUser
-from authentication.serializers import UserSerializer, LoginSerializer, SessionSerializer, ProfileSerializer
-from authentication.models import Profile
+from authentication.serializers import UserSerializer, LoginSerializer, SessionSerializer, ProfileSerializer, UserImportJobSerializer
+from authentication.models import Profile, UserImportJob
+from authentication.hashing import PasswordVerificationUnavailable
+from authentication.bulk_import import create_import_job, detect_format, IMPORT_FORMATS, ImportInProgress
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
 from core.utils import api_response, paginate_queryset
 import logging
 
@@ -13,6 +16,7 @@ logger = logging.getLogger('authentication')
 class RegisterView(APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_scope = 'register'
 
     def post(self, request):
         serializer = UserSerializer(data=request.data)
@@ -34,10 +38,18 @@ class RegisterView(APIView):
 class LoginView(APIView):
     authentication_classes = []
     permission_classes = [AllowAny]
+    throttle_scope = 'login'
 
     def post(self, request):
         serializer = LoginSerializer(data=request.data)
-        if serializer.is_valid():
+        try:
+            is_valid = serializer.is_valid()
+        except PasswordVerificationUnavailable as e:
+            logger.warning(f"Login shed: {e}")
+            response = api_response(message="Login temporarily unavailable, retry shortly", status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response['Retry-After'] = '1'
+            return response
+        if is_valid:
             user = serializer.validated_data['user']
             token = serializer.validated_data['token']
             logger.info(f"User {user.username} logged in successfully")
@@ -54,7 +66,7 @@ class LoginView(APIView):
         )
 
 class SessionView(APIView):
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def post(self, request):
@@ -74,17 +86,56 @@ class SessionView(APIView):
             errors=serializer.errors
         )
 
-class ProfileListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class UserImportView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return api_response(message="Upload a CSV or NDJSON file as 'file'", status_code=status.HTTP_400_BAD_REQUEST)
+        fmt = request.data.get('format') or detect_format(upload.name)
+        if fmt not in IMPORT_FORMATS:
+            return api_response(message=f"Unsupported format '{fmt}'", status_code=status.HTTP_400_BAD_REQUEST)
+        # Hashing takes minutes for large files, so the import runs in its own process
+        try:
+            job = create_import_job(upload, fmt)
+        except ImportInProgress as e:
+            logger.warning(f"User import refused: {str(e)}")
+            return api_response(message="Another import is in progress", status_code=status.HTTP_409_CONFLICT, errors={"detail": str(e)})
+        logger.info(f"User import {job.id} queued by {request.user.username}")
+        return api_response(
+            data=UserImportJobSerializer(job).data,
+            message="Import started",
+            status_code=status.HTTP_202_ACCEPTED
+        )
+
+class UserImportJobDetailView(APIView):
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+
+    def get(self, request, job_id):
+        try:
+            job = UserImportJob.objects.get(id=job_id)
+            return api_response(data=UserImportJobSerializer(job).data, message="Import job retrieved successfully")
+        except UserImportJob.DoesNotExist:
+            return api_response(message="Import job not found", status_code=status.HTTP_404_NOT_FOUND)
+
+class ProfileListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsSuperAdmin]
 
     def get(self, request):
         profiles = Profile.objects.all()
+        not_modified = self.not_modified(request, queryset_validators(request, profiles))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(profiles, request)
         serializer = ProfileSerializer(paginated_data['results'], many=True)
         return api_response(
             data={"profiles": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Profiles retrieved successfully"
+            message="Profiles retrieved successfully",
+            request=request
         )
 
     def post(self, request):
@@ -104,13 +155,16 @@ class ProfileListCreateView(APIView):
             errors=serializer.errors
         )
 
-class ProfileDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ProfileDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsSuperAdmin]
 
     def get(self, request, profile_id):
         try:
             profile = Profile.objects.get(id=profile_id)
+            not_modified = self.not_modified(request, instance_validators(request, profile))
+            if not_modified:
+                return not_modified
             serializer = ProfileSerializer(profile)
             return api_response(data=serializer.data, message="Profile retrieved successfully")
         except Profile.DoesNotExist:
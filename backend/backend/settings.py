@@ -46,6 +46,7 @@ INSTALLED_APPS = [
     'notifications',
     'records',
     'core',
+    'changelog',
 ]
 
 AUTHENTICATION_BACKENDS = [
@@ -54,6 +55,7 @@ AUTHENTICATION_BACKENDS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.QueryBudgetMiddleware',  # Query counts, DB time and N+1 detection per request
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # Must be before CommonMiddleware
     'django.middleware.common.CommonMiddleware',
@@ -66,6 +68,100 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'backend.urls'
 
+# Query budget instrumentation (core.middleware.QueryBudgetMiddleware)
+QUERY_BUDGET_DEFAULT = int(os.getenv('QUERY_BUDGET_DEFAULT', '20'))
+QUERY_BUDGETS = {
+    'general-listview': 5,
+    'general-detail': 4,
+    'general-batch-detail': 20,
+    'general-aggregate': 3,
+}
+QUERY_BUDGET_REPEAT_THRESHOLD = 5  # Same SQL shape this many times in one request is flagged as N+1
+QUERY_BUDGET_HEADERS = DEBUG  # X-Query-Count / X-Query-Time-Ms headers outside production
+
+# Shared cache for table versions, list ETags, cached counts and cached responses (core.shared_cache).
+# RedisCache needs the redis package; without REDIS_URL only a single-process DEBUG server may start
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+CACHE_ALLOW_PROCESS_LOCAL = DEBUG and not os.getenv('REDIS_URL')
+
+# Pagination count strategies (core.counts): 'exact', 'cached' or 'estimated', per model label
+PAGINATION_COUNT_STRATEGY = 'exact'
+PAGINATION_COUNT_STRATEGIES = {
+    'notifications.notification': 'cached',
+    'orders.case': 'cached',  # Case lists always filter on isActive/accountId, which 'estimated' would only fall back from
+}
+PAGINATION_COUNT_CACHE_TIMEOUT = 300  # Seconds a cached count is kept
+PAGINATION_COUNT_ESTIMATE_THRESHOLD = 100000  # Tables smaller than this get a cached exact count
+# 'estimated' only applies to unfiltered lists; use it for tables listed without a WHERE clause
+
+# Read-through cache for the public catalog endpoints (core.response_cache)
+RESPONSE_CACHE_TIMEOUT = 60  # Seconds an entry is served as fresh
+RESPONSE_CACHE_STALE_TIMEOUT = 30  # Extra seconds a stale entry is served while one request rebuilds it
+RESPONSE_CACHE_LOCK_TIMEOUT = 10  # Upper bound on a rebuild before another request may take over
+RESPONSE_CACHE_LOCK_WAIT = 1  # Seconds a cold miss waits for the rebuilding request
+
+API_JSON_BACKEND = 'orjson'  # 'orjson' when installed, otherwise 'stdlib' (core.encoders)
+
+# Field-level change log (changelog app); Login and Session are left out because they hold credentials,
+# and CHANGELOG_EXCLUDE_FIELDS keeps sensitive columns of tracked models out of the append-only table
+CHANGELOG_MODELS = [
+    'authentication.Profile', 'authentication.User', 'payments.BankCard',
+    'products.Product', 'products.PriceBook', 'products.ProductItem',
+    'orders.ShoppingCart', 'orders.Case', 'notifications.Notification',
+    'records.RecordType', 'records.Address',
+]
+CHANGELOG_EXCLUDE_FIELDS = {
+    'payments.BankCard': ['cardNumber', 'cvv', 'expiryDate', 'cardHolderName'],
+}
+CHANGELOG_ASYNC = True  # False writes each entry on commit, without the background thread
+CHANGELOG_BUFFER_SIZE = 10000  # Entries held in memory before saves start applying backpressure
+CHANGELOG_BATCH_SIZE = 500
+CHANGELOG_FLUSH_INTERVAL = 1.0  # Seconds between flushes when the buffer is not filling up
+CHANGELOG_BACKPRESSURE_TIMEOUT = 0.5  # Seconds a save waits on a full buffer before flushing itself
+CHANGELOG_WRITE_RETRIES = 3  # Attempts per batch before it is appended to the fallback file
+CHANGELOG_FALLBACK_PATH = BASE_DIR / 'logs' / 'changelog-fallback.ndjson'  # Replay with manage.py replay_changelog
+
+# Login password verification pool (authentication.hashing)
+LOGIN_HASH_WORKERS = None  # Defaults to the CPU count
+LOGIN_HASH_QUEUE_LIMIT = 32  # Verifications allowed to wait for a worker before logins get a 503
+LOGIN_HASH_TIMEOUT = 5  # Seconds
+
+# In-process cache of authenticated users (authentication.authentication)
+PRINCIPAL_CACHE_SIZE = 10000
+PRINCIPAL_CACHE_TTL = 60  # Seconds; bounds how long other processes see a stale user or profile
+
+# Session codes (authentication.Session); expired rows are removed by the purge_sessions command
+SESSION_CODE_TTL = 900  # Seconds a session code stays usable
+SESSION_PURGE_BATCH_SIZE = 1000  # Rows deleted per statement, so a purge never holds long locks
+
+# Bulk user import (authentication.bulk_import)
+USER_IMPORT_BATCH_SIZE = 1000  # Rows per bulk_create; the next batch hashes while this one is written
+USER_IMPORT_WORKERS = None  # Hashing processes, defaults to the CPU count
+USER_IMPORT_UPLOAD_DIR = BASE_DIR / 'imports'  # Uploads waiting for their import_users --job process
+USER_IMPORT_JOB_TIMEOUT = 600  # Seconds a job may go without finishing a batch before it is marked FAILED
+
+# Token-bucket throttling shared by the workers of a host (core.throttling), by view throttle_scope
+THROTTLE_RATES = {
+    'login': '10/min',
+    'register': '5/min',
+    'generic': '120/min',
+    'default': '600/min',
+}
+THROTTLE_STORE_PATH = None  # Memory-mapped bucket file; defaults to <tmp>/backend-throttle.bin
+THROTTLE_STORE_SLOTS = 65536
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",  # Frontend-admin (React)
     "http://localhost:8081",  # Frontend-user (React Native)
@@ -144,6 +240,11 @@ LOGGING = {
             'level': 'DEBUG' if DEBUG else 'INFO',
             'propagate': False,
         },
+        'changelog': {
+            'handlers': ['console', 'file'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -186,12 +287,20 @@ DATABASES = {
 # REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-        'rest_framework.authentication.TokenAuthentication',
+        'authentication.authentication.JWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.FastJSONRenderer',
+        'core.renderers.ColumnarJSONRenderer',
+        'core.renderers.MsgPackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_THROTTLE_CLASSES': [
+        'core.throttling.TokenBucketThrottle',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
 }
@@ -12,4 +12,5 @@ urlpatterns = [
     path('api/', include('notifications.urls')),
     path('api/', include('core.urls')),
     path('api/', include('records.urls')),
+    path('api/', include('changelog.urls')),
 ]
\ No newline at end of file
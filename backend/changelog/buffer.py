@@ -0,0 +1,124 @@
+"""
+In-memory buffer between the save path and the ChangeLog table.
+
+Receivers hand entries over with enqueue() once the surrounding transaction commits. A
+daemon thread drains the queue and writes it with bulk_create, CHANGELOG_BATCH_SIZE rows
+at a time or every CHANGELOG_FLUSH_INTERVAL seconds. When the queue is full the saving
+thread waits up to CHANGELOG_BACKPRESSURE_TIMEOUT seconds and then writes a batch itself,
+so entries are never dropped and callers slow down instead. Whatever is left is flushed
+at interpreter exit.
+
+A batch the database refuses is retried CHANGELOG_WRITE_RETRIES times, each attempt in one
+transaction so a retry never duplicates rows, and then appended to CHANGELOG_FALLBACK_PATH
+as NDJSON for the replay_changelog command.
+"""
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, transaction
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+RETRY_BACKOFF = 0.5  # Seconds, doubled after each failed attempt
+FALLBACK_FIELDS = ('id', 'table', 'rowId', 'action', 'changes', 'changedById_id', 'createdDate')
+
+logger = logging.getLogger('changelog')
+
+class ChangeLogBuffer:
+    def __init__(self):
+        self.queue = queue.Queue(maxsize=getattr(settings, 'CHANGELOG_BUFFER_SIZE', 10000))
+        self.batch_size = getattr(settings, 'CHANGELOG_BATCH_SIZE', 500)
+        self.flush_interval = getattr(settings, 'CHANGELOG_FLUSH_INTERVAL', 1.0)
+        self.backpressure_timeout = getattr(settings, 'CHANGELOG_BACKPRESSURE_TIMEOUT', 0.5)
+        self.write_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = None
+        self.pid = None
+
+    def ensure_worker(self):
+        # Threads do not survive fork, so each worker process starts its own
+        if self.thread is not None and self.pid == os.getpid() and self.thread.is_alive():
+            return
+        self.pid = os.getpid()
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name='changelog-writer', daemon=True)
+        self.thread.start()
+
+    def enqueue(self, entry):
+        if not getattr(settings, 'CHANGELOG_ASYNC', True):
+            self.write([entry])
+            return
+        self.ensure_worker()
+        try:
+            self.queue.put(entry, timeout=self.backpressure_timeout)
+        except queue.Full:
+            logger.warning("Change log buffer full; flushing in the request thread")
+            self.flush()
+            self.queue.put(entry)
+
+    def drain(self, limit):
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def write(self, batch):
+        from changelog.models import ChangeLog
+        attempts = getattr(settings, 'CHANGELOG_WRITE_RETRIES', 3)
+        with self.write_lock:
+            for attempt in range(1, attempts + 1):
+                try:
+                    with transaction.atomic():
+                        ChangeLog.objects.bulk_create(batch, batch_size=self.batch_size)
+                    return
+                except Exception:
+                    logger.exception(f"Failed to write {len(batch)} change log entries (attempt {attempt}/{attempts})")
+                    close_old_connections()
+                    if attempt < attempts:
+                        time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+            self.write_fallback(batch)
+
+    def write_fallback(self, batch):
+        path = getattr(settings, 'CHANGELOG_FALLBACK_PATH', None)
+        if not path:
+            logger.error(f"Dropped {len(batch)} change log entries: no CHANGELOG_FALLBACK_PATH configured")
+            return
+        with open(path, 'a', encoding='utf-8') as fallback:
+            for entry in batch:
+                fallback.write(json.dumps({name: getattr(entry, name) for name in FALLBACK_FIELDS}, cls=DjangoJSONEncoder) + '\n')
+        logger.error(f"Wrote {len(batch)} change log entries to {path}")
+
+    def flush(self):
+        """
+        Write everything currently buffered.
+        """
+        while True:
+            batch = self.drain(self.batch_size)
+            if not batch:
+                return
+            self.write(batch)
+
+    def run(self):
+        while not self.stopping.is_set():
+            try:
+                first = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            close_old_connections()
+            self.write([first] + self.drain(self.batch_size - 1))
+
+    def stop(self):
+        self.stopping.set()
+        if self.thread is not None and self.thread.is_alive():
+            self.thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+
+change_log_buffer = ChangeLogBuffer()
+atexit.register(change_log_buffer.stop)
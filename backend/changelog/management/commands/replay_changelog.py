@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from changelog.models import ChangeLog
+import json
+import os
+
+class Command(BaseCommand):
+    help = "Load change log entries the writer could not store from the fallback file, then remove it"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', help="Defaults to CHANGELOG_FALLBACK_PATH")
+        parser.add_argument('--batch-size', type=int, default=getattr(settings, 'CHANGELOG_BATCH_SIZE', 500))
+
+    def handle(self, *args, **options):
+        path = options['path'] or getattr(settings, 'CHANGELOG_FALLBACK_PATH', None)
+        replaying = f"{path}.replaying"
+        # Moved aside first so entries the writer falls back on meanwhile go to a fresh file;
+        # a file left over from an interrupted replay is finished first
+        if path and not os.path.exists(replaying):
+            if not os.path.exists(path):
+                raise CommandError(f"No fallback file at {path}")
+            os.replace(path, replaying)
+        entries = []
+        with open(replaying, encoding='utf-8') as fallback:
+            for line in fallback:
+                if line.strip():
+                    row = json.loads(line)
+                    row['createdDate'] = parse_datetime(row['createdDate'])
+                    entries.append(ChangeLog(**row))
+        # Entries keep their IDs, so replaying a file twice does not duplicate them
+        ChangeLog.objects.bulk_create(entries, batch_size=options['batch_size'], ignore_conflicts=True)
+        os.remove(replaying)
+        self.stdout.write(f"Replayed {len(entries)} change log entries from {path}")
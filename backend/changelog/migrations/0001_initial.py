@@ -0,0 +1,35 @@
+# Generated by Django 4.2.20 on 2026-10-18 05:01
+
+import core.encoders
+import core.utils
+from django.db import migrations, models
+import django.db.models.deletion
+import functools
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('authentication', '0004_callable_id_defaults'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.CharField(default=functools.partial(core.utils.generate_unique_id, *('CHG',), **{}), max_length=20, primary_key=True, serialize=False)),
+                ('table', models.CharField(max_length=50)),
+                ('rowId', models.CharField(max_length=20)),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')], max_length=10)),
+                ('changes', models.JSONField(default=dict, encoder=core.encoders.APIJSONEncoder)),
+                ('createdDate', models.DateTimeField()),
+                ('changedById', models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='changes', to='authentication.user')),
+            ],
+            options={
+                'db_table': 'ChangeLog',
+                'indexes': [models.Index(fields=['table', 'rowId', 'createdDate'], name='changelog_row_idx'), models.Index(fields=['table', 'createdDate'], name='changelog_table_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import models
+from core.encoders import APIJSONEncoder
+from core.utils import generate_unique_id, unique_id_default
+from authentication.models import User
+
+class ChangeLog(models.Model):
+    """
+    Append-only field-level history of the audited models, written in batches by changelog.buffer.
+    """
+    ACTIONS = (
+        ('create', 'Create'),
+        ('update', 'Update'),
+        ('delete', 'Delete'),
+    )
+
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("CHG"))
+    table = models.CharField(max_length=50)
+    rowId = models.CharField(max_length=20)
+    action = models.CharField(max_length=10, choices=ACTIONS)
+    changes = models.JSONField(encoder=APIJSONEncoder, default=dict)  # {field: [old, new]}
+    changedById = models.ForeignKey(User, on_delete=models.DO_NOTHING, null=True, db_constraint=False, related_name='changes')
+    createdDate = models.DateTimeField()  # Time of the change, not of the batched insert
+
+    def save(self, *args, **kwargs):
+        if not self.id:
+            self.id = generate_unique_id("CHG")
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.action} {self.table} {self.rowId}"
+
+    class Meta:
+        db_table = 'ChangeLog'
+        indexes = [
+            models.Index(fields=['table', 'rowId', 'createdDate'], name='changelog_row_idx'),
+            models.Index(fields=['table', 'createdDate'], name='changelog_table_idx'),
+        ]
@@ -0,0 +1,8 @@
+from rest_framework import serializers
+from changelog.models import ChangeLog
+
+class ChangeLogSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ChangeLog
+        fields = ['id', 'table', 'rowId', 'action', 'changes', 'changedById', 'createdDate']
+        read_only_fields = fields
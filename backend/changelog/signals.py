@@ -0,0 +1,82 @@
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_init, post_save, post_delete
+from django.utils import timezone
+from core.signals import AUDIT_FIELD_MAP, audit_user
+from changelog.buffer import change_log_buffer
+
+# Bookkeeping columns that change on every save and are already on the row itself
+UNTRACKED_FIELDS = ('createdDate', 'lastModifiedDate', 'createdById', 'lastModifiedById')
+BINARY_PLACEHOLDER = '<binary>'
+
+# model -> ({attname: field name}, binary attnames), filled by connect_change_tracking()
+TRACKED_FIELDS = {}
+
+def snapshot(sender, instance, **kwargs):
+    """
+    post_init receiver remembering the loaded values; deferred fields are simply not tracked.
+    """
+    values = instance.__dict__
+    instance._changelog_snapshot = {name: values[name] for name in TRACKED_FIELDS[sender][0] if name in values}
+
+def _value(value, binary):
+    return BINARY_PLACEHOLDER if binary and value is not None else value
+
+def _record(sender, instance, action, changes):
+    from changelog.models import ChangeLog
+    entry = ChangeLog(
+        table=sender._meta.db_table,
+        rowId=instance.pk,
+        action=action,
+        changes=changes,
+        changedById_id=audit_user(sender) if sender in AUDIT_FIELD_MAP else None,
+        createdDate=timezone.now(),
+    )
+    transaction.on_commit(lambda: change_log_buffer.enqueue(entry), using=instance._state.db)
+
+def record_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    fields, binary = TRACKED_FIELDS[sender]
+    before = {} if created else getattr(instance, '_changelog_snapshot', {})
+    after = {name: instance.__dict__[name] for name in fields if name in instance.__dict__}
+    changes = {
+        fields[name]: [_value(before.get(name), name in binary), _value(value, name in binary)]
+        for name, value in after.items()
+        if created or (name in before and before[name] != value)
+    }
+    instance._changelog_snapshot = after
+    if changes:
+        _record(sender, instance, 'create' if created else 'update', changes)
+
+def record_bulk_create(model, instances):
+    """
+    Record 'create' entries for rows written with bulk_create, which sends no post_save.
+    """
+    if model in TRACKED_FIELDS:
+        for instance in instances:
+            record_save(model, instance, created=True)
+
+def record_delete(sender, instance, **kwargs):
+    fields, binary = TRACKED_FIELDS[sender]
+    before = getattr(instance, '_changelog_snapshot', {})
+    _record(sender, instance, 'delete', {fields[name]: [_value(value, name in binary), None] for name, value in before.items()})
+
+def connect_change_tracking():
+    """
+    Track every model listed in CHANGELOG_MODELS. Called once from ChangelogConfig.ready().
+    """
+    excluded_fields = getattr(settings, 'CHANGELOG_EXCLUDE_FIELDS', {})
+    for label in getattr(settings, 'CHANGELOG_MODELS', []):
+        model = apps.get_model(label)
+        untracked = set(UNTRACKED_FIELDS) | set(excluded_fields.get(label, ()))
+        concrete = [field for field in model._meta.concrete_fields if field.name not in untracked and not field.primary_key]
+        TRACKED_FIELDS[model] = (
+            {field.attname: field.name for field in concrete},
+            {field.attname for field in concrete if isinstance(field, models.BinaryField)},
+        )
+        uid = model._meta.label_lower
+        post_init.connect(snapshot, sender=model, dispatch_uid=f"changelog-snapshot-{uid}")
+        post_save.connect(record_save, sender=model, dispatch_uid=f"changelog-save-{uid}")
+        post_delete.connect(record_delete, sender=model, dispatch_uid=f"changelog-delete-{uid}")
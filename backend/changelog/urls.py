@@ -0,0 +1,6 @@
+from django.urls import path
+from changelog.views import ChangeLogListView
+
+urlpatterns = [
+    path('changelog/', ChangeLogListView.as_view(), name='changelog-list'),
+]
@@ -0,0 +1,50 @@
+from rest_framework.views import APIView
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from authentication.authentication import JWTAuthentication
+from django.utils.dateparse import parse_datetime
+from authentication.permissions import IsAdmin
+from changelog.models import ChangeLog
+from changelog.serializers import ChangeLogSerializer
+from core.registry import table_registry
+from core.utils import api_response, paginate_queryset
+import logging
+
+logger = logging.getLogger('changelog')
+
+class ChangeLogListView(APIView):
+    """
+    GET /api/changelog/?table=product&rowId=PRD-...&since=...&until=...
+    Served by the (table, rowId, createdDate) index, newest first.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+
+    def get(self, request):
+        spec = table_registry.get(request.query_params.get('table', ''))
+        if spec is None:
+            return api_response(message="A valid 'table' parameter is required", status_code=status.HTTP_400_BAD_REQUEST)
+
+        entries = ChangeLog.objects.filter(table=spec.model._meta.db_table)
+        row_id = request.query_params.get('rowId')
+        if row_id:
+            entries = entries.filter(rowId=row_id)
+        for param, lookup in (('since', 'createdDate__gte'), ('until', 'createdDate__lt')):
+            value = request.query_params.get(param)
+            if value:
+                moment = parse_datetime(value)
+                if moment is None:
+                    return api_response(message=f"Invalid '{param}' datetime", status_code=status.HTTP_400_BAD_REQUEST)
+                entries = entries.filter(**{lookup: moment})
+
+        try:
+            paginated_data = paginate_queryset(entries, request, ordering=('-createdDate', '-id'))
+        except ParseError as e:
+            return api_response(message="Invalid pagination parameters", status_code=status.HTTP_400_BAD_REQUEST, errors=str(e.detail))
+        serializer = ChangeLogSerializer(paginated_data['results'], many=True)
+        logger.info(f"Retrieved change log for {spec.name} {row_id or ''} by {request.user.username}")
+        return api_response(
+            data={"changes": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
+            message="Change log retrieved successfully",
+            request=request
+        )
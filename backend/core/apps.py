@@ -5,4 +5,11 @@ class CoreConfig(AppConfig):
     name = 'core'
 
     def ready(self):
-        import core.signals  # Import signals to register them
\ No newline at end of file
+        from core.signals import connect_audit_stamping
+        from core.registry import table_registry
+        from core.counts import connect_count_invalidation
+        from core.shared_cache import require_shared_cache
+        require_shared_cache()
+        connect_audit_stamping()
+        table_registry.build()
+        connect_count_invalidation([spec.model for spec in table_registry])
\ No newline at end of file
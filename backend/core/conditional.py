@@ -0,0 +1,86 @@
+"""
+ETag / Last-Modified support for list and detail responses.
+
+List ETags come from the version of every table the query reads (core.counts), kept in the
+cache every worker shares (core.shared_cache), so they cost no query; lists carry no Last-Modified, since a delete would not move it forward. Detail
+validators come from the row that was already fetched. Both are mixed with the request path,
+response encoding, body and user, so different pages, filters, encodings or users never share
+an ETag. A matching If-None-Match (or If-Modified-Since, for details) returns 304 before
+anything is serialized.
+
+Views mix in ConditionalMixin and call self.not_modified(request, validators) once they have
+the validators; the mixin attaches them to whatever the handler returns.
+"""
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, parse_http_date_safe, parse_etags
+from core.counts import queryset_tables, table_versions
+from core.encoders import negotiate_encoding
+import hashlib
+import json
+
+def _make_etag(request, *parts):
+    body = json.dumps(request.data, sort_keys=True, default=str) if request.method == 'POST' else ''
+    user = request.user.pk if request.user.is_authenticated else 'anonymous'
+    digest = hashlib.md5('|'.join(map(str, (request.get_full_path(), negotiate_encoding(request), body, user) + parts)).encode()).hexdigest()
+    return f'"{digest}"'
+
+def queryset_validators(request, queryset):
+    """
+    (etag, None) for a list response, without querying the database.
+    """
+    versions = table_versions(queryset_tables(queryset))
+    return _make_etag(request, *sorted(versions.items())), None
+
+def instance_validators(request, instance):
+    """
+    (etag, last_modified) for a detail response.
+    """
+    return _make_etag(request, instance.pk, instance.lastModifiedDate), instance.lastModifiedDate
+
+def is_not_modified(request, validators):
+    """
+    Evaluate If-None-Match (preferred) or If-Modified-Since against the validators.
+    """
+    etag, last_modified = validators
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return '*' in etags or etag in etags or f"W/{etag}" in etags
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    if if_modified_since and last_modified:
+        return int(last_modified.timestamp()) <= if_modified_since
+    return False
+
+def set_validators(response, validators):
+    """
+    Attach ETag / Last-Modified to a successful response.
+    """
+    etag, last_modified = validators
+    if 200 <= response.status_code < 300 or response.status_code == 304:
+        response['ETag'] = etag
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+        patch_vary_headers(response, ('Authorization',))
+    return response
+
+def not_modified_response(validators):
+    return set_validators(HttpResponseNotModified(), validators)
+
+class ConditionalMixin:
+    """
+    Conditional GET for APIViews.
+    """
+    validators = None
+
+    def not_modified(self, request, validators):
+        """
+        Remember the validators for this response and return the 304 to send, if any.
+        """
+        self.validators = validators
+        return not_modified_response(validators) if is_not_modified(request, validators) else None
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self.validators is not None and not response.has_header('ETag'):
+            set_validators(response, self.validators)
+        return super().finalize_response(request, response, *args, **kwargs)
\ No newline at end of file
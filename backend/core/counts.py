@@ -0,0 +1,125 @@
+"""
+Count strategies for paginate_queryset.
+
+- exact: COUNT(*) on every request (Django's default).
+- cached: COUNT(*) cached per (tables, query) with a TTL; every save/delete on one of
+  the tables involved bumps a version key, which orphans the cached counts. The same
+  table versions back the list ETags in core.conditional.
+- estimated: table statistics for unfiltered lists of tables above a row threshold;
+  smaller tables and filtered lists fall back to the cached count.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models.signals import post_save, post_delete
+from django.utils.functional import cached_property
+import hashlib
+import time
+
+COUNT_STRATEGIES = ('exact', 'cached', 'estimated')
+
+def get_count_strategy(model):
+    """
+    Strategy configured for a model in PAGINATION_COUNT_STRATEGIES, else PAGINATION_COUNT_STRATEGY.
+    """
+    strategies = getattr(settings, 'PAGINATION_COUNT_STRATEGIES', {})
+    return strategies.get(model._meta.label_lower, getattr(settings, 'PAGINATION_COUNT_STRATEGY', 'exact'))
+
+def _version_key(db_table):
+    return f"count-version:{db_table}"
+
+def bump_count_version(sender, **kwargs):
+    """
+    post_save/post_delete receiver invalidating every cached count that involves the sender's table.
+    """
+    key = _version_key(sender._meta.db_table)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+
+def table_versions(tables):
+    """
+    Current version of each table, from the shared cache (core.shared_cache). Versions start
+    from the clock, so one lost to eviction never repeats an earlier value.
+    """
+    keys = {table: _version_key(table) for table in tables}
+    versions = cache.get_many(keys.values())
+    for table, key in keys.items():
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key, 0)
+    return {table: versions[key] for table, key in keys.items()}
+
+def queryset_tables(queryset):
+    return sorted({alias.table_name for alias in queryset.query.alias_map.values()} or {queryset.model._meta.db_table})
+
+def connect_count_invalidation(models):
+    """
+    Register invalidation receivers for the given models. Called once from CoreConfig.ready().
+    """
+    for model in models:
+        post_save.connect(bump_count_version, sender=model, dispatch_uid=f"count-version-save-{model._meta.label_lower}")
+        post_delete.connect(bump_count_version, sender=model, dispatch_uid=f"count-version-delete-{model._meta.label_lower}")
+
+def cached_count(queryset):
+    tables = queryset_tables(queryset)
+    versions = table_versions(tables)
+    sql, params = queryset.query.sql_with_params()
+    fingerprint = hashlib.md5(f"{sql}|{params}|{[versions[table] for table in tables]}".encode()).hexdigest()
+    key = f"count:{queryset.db}:{'+'.join(tables)}:{fingerprint}"
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, getattr(settings, 'PAGINATION_COUNT_CACHE_TIMEOUT', 300))
+    return count
+
+def table_row_estimate(model, using='default'):
+    """
+    Row estimate from the database statistics, or None when the backend has none.
+    """
+    connection = connections[using]
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [model._meta.db_table]
+            )
+        elif connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [model._meta.db_table])
+        else:
+            return None
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None and row[0] >= 0 else None
+
+def estimated_count(queryset):
+    if not queryset.query.where:
+        estimate = table_row_estimate(queryset.model, queryset.db)
+        if estimate is not None and estimate >= getattr(settings, 'PAGINATION_COUNT_ESTIMATE_THRESHOLD', 100000):
+            return estimate
+    return cached_count(queryset)
+
+def get_count(queryset, strategy='exact'):
+    """
+    Count a queryset with the given strategy.
+    """
+    if strategy == 'cached':
+        return cached_count(queryset)
+    if strategy == 'estimated':
+        return estimated_count(queryset)
+    return queryset.count()
+
+class CountStrategyPaginator(Paginator):
+    """
+    Django paginator whose total count comes from a count strategy.
+    """
+    def __init__(self, *args, count_strategy='exact', **kwargs):
+        self.count_strategy = count_strategy
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def count(self):
+        if not hasattr(self.object_list, 'query'):
+            return super().count
+        return get_count(self.object_list, self.count_strategy)
\ No newline at end of file
@@ -0,0 +1,113 @@
+"""
+JSON encoding for api_response and the DRF renderer.
+
+API_JSON_BACKEND picks the encoder: 'orjson' (used when installed) or 'stdlib'. Both emit
+compact UTF-8 and run Decimal, date/time, lazy strings and bytes through the same
+APIJSONEncoder.default, and both encode NaN and infinities as null, so switching backends
+never changes the decoded document. The bytes can differ in how floats are spelled (orjson
+writes 1e16 where the stdlib writes 1e+16). Payloads orjson rejects (e.g. integers wider than 64 bits) fall back to the stdlib path.
+
+List endpoints can also be asked for a columnar layout, where every list of rows is sent as
+{"columns": [...], "rows": [[...], ...]}, either as JSON or, when msgpack is installed, as
+MessagePack. Clients opt in with ?encoding=columnar|msgpack or the matching Accept type.
+"""
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+import base64
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+COLUMNAR_MEDIA_TYPE = 'application/vnd.columnar+json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+ENCODINGS = {'columnar': COLUMNAR_MEDIA_TYPE, 'msgpack': MSGPACK_MEDIA_TYPE}
+
+class APIJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder plus base64 for bytes, matching how BinaryField is serialized.
+    """
+    def default(self, o):
+        if isinstance(o, (bytes, bytearray, memoryview)):
+            return base64.b64encode(bytes(o)).decode('ascii')
+        return super().default(o)
+
+_default = APIJSONEncoder().default
+
+def _finite(data):
+    """
+    Copy of data with NaN and infinities replaced by None.
+    """
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+def stdlib_dumps(data):
+    try:
+        return json.dumps(data, cls=APIJSONEncoder, separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode('utf-8')
+    except ValueError:
+        # NaN/Infinity are not JSON; send null as orjson does
+        return json.dumps(_finite(data), cls=APIJSONEncoder, separators=(',', ':'), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+def orjson_dumps(data):
+    try:
+        # Datetimes are passed through so they get DjangoJSONEncoder's millisecond format
+        return orjson.dumps(data, default=_default, option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return stdlib_dumps(data)
+
+JSON_BACKENDS = {'stdlib': stdlib_dumps}
+if orjson is not None:
+    JSON_BACKENDS['orjson'] = orjson_dumps
+
+def dumps(data):
+    """
+    Encode data to JSON bytes with the configured backend.
+    """
+    return JSON_BACKENDS.get(getattr(settings, 'API_JSON_BACKEND', 'orjson'), stdlib_dumps)(data)
+
+def negotiate_encoding(request):
+    """
+    'json', 'columnar' or 'msgpack' for a request; msgpack degrades to columnar JSON when
+    the library is missing.
+    """
+    encoding = request.GET.get('encoding')
+    if encoding not in ENCODINGS:
+        accept = request.META.get('HTTP_ACCEPT', '')
+        encoding = next((name for name, media_type in ENCODINGS.items() if media_type in accept), 'json')
+    if encoding == 'msgpack' and msgpack is None:
+        return 'columnar'
+    return encoding
+
+def to_columns(rows):
+    """
+    Turn a list of serialized rows into {"columns": [...], "rows": [[...], ...]}.
+    """
+    columns = list(rows[0]) if rows else []
+    return {'columns': columns, 'rows': [[row.get(column) for column in columns] for row in rows]}
+
+def columnar(data):
+    """
+    Apply to_columns to data itself or to each top-level list of rows inside it.
+    """
+    is_rows = lambda value: isinstance(value, list) and all(isinstance(row, dict) for row in value)
+    if is_rows(data):
+        return to_columns(data)
+    if isinstance(data, dict):
+        return {key: to_columns(value) if is_rows(value) else value for key, value in data.items()}
+    return data
+
+def msgpack_dumps(data):
+    return msgpack.packb(data, default=_default, use_bin_type=True)
@@ -0,0 +1,53 @@
+"""
+Streaming NDJSON/CSV exports of the generic tables.
+
+Rows are read in keyset chunks on the primary key and encoded chunk by chunk,
+so memory stays flat whatever the size of the table.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+import csv
+import json
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+DEFAULT_CHUNK_SIZE = 2000
+
+class Echo:
+    """
+    File-like object whose write() hands the encoded line back to the caller.
+    """
+    def write(self, value):
+        return value
+
+def iterate_in_chunks(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield lists of rows ordered by primary key, one bounded query per chunk.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+def export_rows(queryset, serializer_class, export_format, fields=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield the encoded lines of an export, header first for CSV.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Format must be one of: {', '.join(EXPORT_FORMATS)}")
+    writer = None
+    if export_format == 'csv':
+        writer = csv.DictWriter(Echo(), fieldnames=list(serializer_class(fields=fields).fields))
+        yield writer.writeheader()
+    for chunk in iterate_in_chunks(queryset, chunk_size):
+        for row in serializer_class(chunk, many=True, fields=fields).data:
+            if writer:
+                yield writer.writerow(row)
+            else:
+                yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
@@ -0,0 +1,135 @@
+"""
+Filter grammar for the generic list endpoints.
+
+Each table in core.registry.TABLES declares which fields can be filtered and with which
+operators. Range operators are only granted on indexed columns; low-cardinality columns
+(flags, statuses) only accept equality so they are applied as residual predicates on top
+of an index-ordered, LIMITed scan.
+"""
+
+from django.db.models import Count, Sum, Min, Max, Avg
+
+# Operator sets
+EXACT = ('exact',)
+KEY = ('exact', 'in')
+RANGE = ('exact', 'gt', 'gte', 'lt', 'lte')
+
+# Every ordering is tie-broken on id so it matches the (createdDate, id) indexes
+DEFAULT_ORDERING = ('-createdDate', '-id')
+ORDERINGS = {
+    '-createdDate': ('-createdDate', '-id'),
+    'createdDate': ('createdDate', 'id'),
+}
+
+MAX_FILTER_CLAUSES = 5
+MAX_IN_VALUES = 100
+DEFAULT_PAGE_SIZE = 10
+MAX_PAGE_SIZE = 100
+# Deeper page-number requests must switch to cursor pagination
+MAX_OFFSET = 10000
+
+AGGREGATE_FUNCTIONS = {'count': Count, 'sum': Sum, 'min': Min, 'max': Max, 'avg': Avg}
+NUMERIC_ONLY_FUNCTIONS = ('sum', 'avg')
+MAX_GROUP_BY_FIELDS = 3
+MAX_AGGREGATES = 5
+MAX_GROUPS = 1000
+
+def compile_filters(grammar, filters):
+    """
+    Validate client filters against a table grammar and return ORM lookups.
+    Raises ValueError for undeclared fields, operators or oversized filters.
+    """
+    if not filters:
+        return {}
+    if not isinstance(filters, dict):
+        raise ValueError("'filters' must be an object")
+    if len(filters) > MAX_FILTER_CLAUSES:
+        raise ValueError(f"At most {MAX_FILTER_CLAUSES} filters are allowed")
+    lookups = {}
+    for key, value in filters.items():
+        field, _, operator = key.partition('__')
+        operator = operator or 'exact'
+        if field not in grammar:
+            raise ValueError(f"Filtering on '{field}' is not allowed")
+        if operator not in grammar[field]:
+            raise ValueError(f"Operator '{operator}' is not allowed on '{field}'")
+        if operator == 'in':
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"'{key}' expects a non-empty list")
+            if len(value) > MAX_IN_VALUES:
+                raise ValueError(f"'{key}' accepts at most {MAX_IN_VALUES} values")
+        elif isinstance(value, (list, dict)):
+            raise ValueError(f"'{key}' expects a single value")
+        lookups[f"{field}__{operator}"] = value
+    return lookups
+
+def resolve_ordering(ordering=None, default=DEFAULT_ORDERING):
+    """
+    Map a client ordering onto one of the index-backed orderings.
+    """
+    if not ordering:
+        return default
+    if ordering not in ORDERINGS:
+        raise ValueError(f"Ordering must be one of: {', '.join(ORDERINGS)}")
+    return ORDERINGS[ordering]
+
+def resolve_page_size(page_size=None):
+    """
+    Validate a client page size and cap it at MAX_PAGE_SIZE.
+    """
+    if page_size in (None, ''):
+        return DEFAULT_PAGE_SIZE
+    try:
+        page_size = int(page_size)
+    except (TypeError, ValueError):
+        raise ValueError("'page_size' must be an integer")
+    if page_size < 1:
+        raise ValueError("'page_size' must be positive")
+    return min(page_size, MAX_PAGE_SIZE)
+
+def check_offset(page, page_size):
+    """
+    Reject page-number requests whose OFFSET would exceed MAX_OFFSET.
+    """
+    try:
+        page = int(page or 1)
+    except (TypeError, ValueError):
+        return
+    if (page - 1) * page_size > MAX_OFFSET:
+        raise ValueError(f"Offsets beyond {MAX_OFFSET} rows require ?pagination=cursor")
+
+
+def compile_aggregates(model, grammar, group_by=None, aggregates=None, hidden=()):
+    """
+    Validate an aggregation request and return (group_by fields, {alias: aggregate expression}).
+    Group-by fields must be declared in the table grammar; the default aggregate is a row count.
+    Hidden fields cannot be aggregated, since min/max would return them verbatim.
+    """
+    group_by = group_by or []
+    if isinstance(group_by, str):
+        group_by = [group_by]
+    if not isinstance(group_by, list) or len(group_by) > MAX_GROUP_BY_FIELDS:
+        raise ValueError(f"'group_by' must be a list of at most {MAX_GROUP_BY_FIELDS} fields")
+    for field in group_by:
+        if field not in grammar:
+            raise ValueError(f"Grouping by '{field}' is not allowed")
+
+    aggregates = aggregates or {'count': 'count'}
+    if not isinstance(aggregates, dict) or len(aggregates) > MAX_AGGREGATES:
+        raise ValueError(f"'aggregates' must be an object with at most {MAX_AGGREGATES} entries")
+    field_names = {field.name: field for field in model._meta.concrete_fields if field.name not in hidden}
+    expressions = {}
+    for alias, spec in aggregates.items():
+        if not isinstance(alias, str) or not alias.isidentifier() or alias in field_names:
+            raise ValueError(f"Invalid aggregate alias '{alias}'")
+        function, field = (spec, 'id') if isinstance(spec, str) else (list(spec) + [None, None])[:2]
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Aggregate must be one of: {', '.join(AGGREGATE_FUNCTIONS)}")
+        if field not in field_names:
+            raise ValueError(f"Unknown field '{field}' in aggregate '{alias}'")
+        if function in NUMERIC_ONLY_FUNCTIONS and field_names[field].get_internal_type() not in (
+            'IntegerField', 'PositiveIntegerField', 'BigIntegerField', 'SmallIntegerField', 'DecimalField', 'FloatField'
+        ):
+            raise ValueError(f"'{function}' needs a numeric field, got '{field}'")
+        expressions[alias] = AGGREGATE_FUNCTIONS[function](field)
+    return group_by, expressions
\ No newline at end of file
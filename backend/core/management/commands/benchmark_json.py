@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from core.encoders import APIJSONEncoder, JSON_BACKENDS
+from core.registry import table_registry
+from core.management.commands.benchmark_serializers import sample_instance
+from decimal import Decimal
+import json
+import time
+
+# Checked for agreement but kept out of the timed payload; NaN sends the stdlib path through its slow fallback
+EDGE_FLOATS = [1e16, 1.5e-7, -0.0, float('nan'), float('inf'), float('-inf')]
+
+class Command(BaseCommand):
+    help = "Compare api_response encoding time of the former JsonResponse path and the core.encoders backends"
+
+    def add_arguments(self, parser):
+        parser.add_argument('tables', nargs='*', default=['product', 'notification'], help="Tables whose serialized rows make up the payload")
+        parser.add_argument('--rows', type=int, default=100, help="Rows per payload (one page)")
+        parser.add_argument('--requests', type=int, default=500, help="Encodings per backend")
+
+    def payload(self, table, rows):
+        spec = table_registry.get(table)
+        if spec is None:
+            raise CommandError(f"Unknown table '{table}'")
+        data = spec.serializer_class([sample_instance(spec.model, index) for index in range(rows)], many=True).data
+        # Raw values as produced by aggregates, exercising the encoder fallbacks
+        extra = {'total': Decimal('1234.50'), 'latest': timezone.now(), 'blob': b'\x89PNG'}
+        return {"status": "success", "message": "Success", "data": {"results": data, "count": rows, "aggregates": extra}}
+
+    def time_per_call(self, encode, payload, requests):
+        start = time.perf_counter()
+        for _ in range(requests):
+            encode(payload)
+        return (time.perf_counter() - start) / requests * 1e6
+
+    def handle(self, *args, **options):
+        # JsonResponse's defaults: spaced separators and ASCII escapes (bytes support added so it can run)
+        legacy = lambda data: json.dumps(data, cls=APIJSONEncoder).encode()
+        self.stdout.write(f"{'table':<14}{'backend':<10}{'us/call':>10}{'speedup':>9}")
+        for table in options['tables']:
+            payload = self.payload(table, options['rows'])
+            # Float spelling may differ between backends (1e16 / 1e+16); the decoded documents may not
+            checked = {'payload': payload, 'floats': EDGE_FLOATS}
+            decoded = [json.loads(dumps(checked)) for dumps in JSON_BACKENDS.values()]
+            if any(document != decoded[0] for document in decoded[1:]):
+                raise CommandError(f"Backends disagree on the '{table}' payload")
+            baseline = self.time_per_call(legacy, payload, options['requests'])
+            self.stdout.write(f"{table:<14}{'legacy':<10}{baseline:>10.1f}{1:>8.1f}x")
+            for name, dumps in JSON_BACKENDS.items():
+                elapsed = self.time_per_call(dumps, payload, options['requests'])
+                self.stdout.write(f"{table:<14}{name:<10}{elapsed:>10.1f}{baseline / elapsed:>8.1f}x")
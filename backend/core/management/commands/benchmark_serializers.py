@@ -0,0 +1,68 @@
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+from rest_framework import serializers
+from core.registry import table_registry
+from decimal import Decimal
+import time
+
+class LegacyDynamicModelSerializer(serializers.ModelSerializer):
+    """
+    The former core.serializers.DynamicModelSerializer, kept here as the benchmark baseline.
+    """
+    def __init__(self, *args, **kwargs):
+        model = kwargs.pop('model', None)
+        super().__init__(*args, **kwargs)
+        if model:
+            self.Meta.model = model
+            self.Meta.fields = '__all__'
+
+    class Meta:
+        fields = '__all__'
+
+def sample_instance(model, index):
+    """
+    Build an unsaved instance with a plausible value in every concrete field.
+    """
+    instance = model()
+    now = timezone.now()
+    for field in model._meta.concrete_fields:
+        if field.is_relation:
+            continue
+        if isinstance(field, models.DateTimeField):
+            value = now
+        elif isinstance(field, models.DecimalField):
+            value = Decimal('19.99')
+        elif isinstance(field, models.BooleanField):
+            value = True
+        elif isinstance(field, (models.IntegerField, models.PositiveIntegerField)):
+            value = index
+        elif isinstance(field, models.BinaryField):
+            value = b'\x89PNG'
+        else:
+            value = f"{field.name}-{index}"[:field.max_length or None]
+        setattr(instance, field.attname, value)
+    return instance
+
+class Command(BaseCommand):
+    help = "Compare per-row serialization time of the legacy dynamic serializer and the registry serializers"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10, help="Rows per serialization call (one page)")
+        parser.add_argument('--requests', type=int, default=500, help="Serialization calls per table")
+
+    def time_per_row(self, build, rows, requests):
+        start = time.perf_counter()
+        for _ in range(requests):
+            build(rows).data
+        return (time.perf_counter() - start) / (requests * len(rows)) * 1e6
+
+    def handle(self, *args, **options):
+        rows_per_call, requests = options['rows'], options['requests']
+        self.stdout.write(f"{'table':<14}{'legacy us/row':>15}{'registry us/row':>17}{'speedup':>9}")
+        for spec in table_registry:
+            model, serializer_class = spec.model, spec.serializer_class
+            rows = [sample_instance(model, index) for index in range(rows_per_call)]
+            legacy = self.time_per_row(lambda page: LegacyDynamicModelSerializer(page, many=True, model=model), rows, requests)
+            registry = self.time_per_row(lambda page: serializer_class(page, many=True), rows, requests)
+            self.stdout.write(f"{spec.name:<14}{legacy:>15.1f}{registry:>17.1f}{legacy / registry:>8.1f}x")
\ No newline at end of file
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from core.export import EXPORT_FORMATS, DEFAULT_CHUNK_SIZE, export_rows
+from core.registry import TABLES, table_registry
+import sys
+
+class Command(BaseCommand):
+    help = "Stream a generic table to NDJSON or CSV with flat memory usage (operator access, no row filters)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('table', help=f"One of: {', '.join(TABLES)}")
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--output', help="Output file (defaults to stdout)")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        spec = table_registry.get(options['table'])
+        if spec is None:
+            raise CommandError(f"Invalid table name: {options['table']}")
+        if not spec.exportable:
+            raise CommandError(f"{spec.name} holds credentials and cannot be exported")
+        table = spec.name
+        lines = export_rows(spec.model.objects.all(), spec.serializer_class, options['format'], chunk_size=options['chunk_size'])
+        output = open(options['output'], 'w', newline='', encoding='utf-8') if options['output'] else sys.stdout
+        try:
+            rows = 0
+            for line in lines:
+                output.write(line)
+                rows += 1
+        finally:
+            if options['output']:
+                output.close()
+        if options['output']:
+            self.stderr.write(f"Exported {rows - (options['format'] == 'csv')} {table} rows to {options['output']}")
\ No newline at end of file
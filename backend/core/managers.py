@@ -0,0 +1,61 @@
+"""
+Bulk-aware audit stamping.
+
+bulk_create, bulk_update and update() skip pre_save, so core.signals.set_audit_fields and
+auto_now never run for them. AuditQuerySet stamps the audit fields itself, resolving the
+current user once per call rather than once per row. They send no post_save either, so the
+table versions behind cached counts, list ETags and cached responses are bumped here once
+per call.
+"""
+from django.db import models
+from django.utils import timezone
+from core.counts import bump_count_version
+from core.response_cache import bump_response_version
+from core.signals import AUDIT_FIELD_MAP, audit_user
+
+class AuditQuerySet(models.QuerySet):
+    def _audit_user(self):
+        return audit_user(self.model) if self.model in AUDIT_FIELD_MAP else None
+
+    def _bump_versions(self):
+        bump_count_version(self.model)
+        bump_response_version(self.model)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        user_id = self._audit_user()
+        if user_id is not None:
+            created, modified, _ = AUDIT_FIELD_MAP[self.model]
+            for obj in objs:
+                if getattr(obj, created) is None:
+                    setattr(obj, created, user_id)
+                setattr(obj, modified, user_id)
+        created_objs = super().bulk_create(objs, *args, **kwargs)
+        self._bump_versions()
+        return created_objs
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs, fields = list(objs), list(fields)
+        now, user_id = timezone.now(), self._audit_user()
+        for obj in objs:
+            obj.lastModifiedDate = now
+        fields.append('lastModifiedDate')
+        if user_id is not None:
+            modified = AUDIT_FIELD_MAP[self.model][1]
+            for obj in objs:
+                setattr(obj, modified, user_id)
+            fields.append('lastModifiedById')
+        updated = super().bulk_update(objs, list(dict.fromkeys(fields)), *args, **kwargs)
+        self._bump_versions()
+        return updated
+
+    def update(self, **kwargs):
+        kwargs.setdefault('lastModifiedDate', timezone.now())
+        user_id = self._audit_user()
+        if user_id is not None and 'lastModifiedById' not in kwargs:
+            kwargs[AUDIT_FIELD_MAP[self.model][1]] = user_id
+        updated = super().update(**kwargs)
+        self._bump_versions()
+        return updated
+
+AuditManager = models.Manager.from_queryset(AuditQuerySet)
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.db import connections
+from contextlib import ExitStack
+import logging
+import re
+import time
+
+logger = logging.getLogger('core')
+
+# Literals are stripped so queries differing only in parameters share a fingerprint
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN \((?:\s*(?:\?|%s)\s*,?)+\)", re.IGNORECASE)
+
+def fingerprint_sql(sql):
+    """
+    Reduce a SQL statement to its shape.
+    """
+    sql = _STRING_LITERAL.sub('?', sql)
+    sql = _NUMBER_LITERAL.sub('?', sql)
+    return _IN_LIST.sub('IN (...)', sql)
+
+class QueryTracker:
+    """
+    connection.execute_wrapper hook counting queries, DB time and repeated SQL shapes.
+    """
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            shape = fingerprint_sql(sql)
+            self.shapes[shape] = self.shapes.get(shape, 0) + 1
+
+    def repeated_shapes(self, threshold):
+        return {shape: count for shape, count in self.shapes.items() if count >= threshold}
+
+class QueryBudgetMiddleware:
+    """
+    Count queries and DB time per request, flag likely N+1 patterns and log requests over budget.
+    Budgets are set per URL name in QUERY_BUDGETS, falling back to QUERY_BUDGET_DEFAULT.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.default_budget = getattr(settings, 'QUERY_BUDGET_DEFAULT', 20)
+        self.budgets = getattr(settings, 'QUERY_BUDGETS', {})
+        self.repeat_threshold = getattr(settings, 'QUERY_BUDGET_REPEAT_THRESHOLD', 5)
+        self.expose_headers = getattr(settings, 'QUERY_BUDGET_HEADERS', settings.DEBUG)
+
+    def __call__(self, request):
+        tracker = QueryTracker()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(tracker))
+            response = self.get_response(request)
+
+        url_name = request.resolver_match.url_name if request.resolver_match else None
+        budget = self.budgets.get(url_name, self.default_budget)
+        repeated = tracker.repeated_shapes(self.repeat_threshold)
+        if tracker.count > budget:
+            logger.warning(
+                f"Query budget exceeded on {url_name or request.path}: {tracker.count} queries "
+                f"(budget {budget}) in {tracker.duration * 1000:.1f}ms"
+            )
+        for shape, count in repeated.items():
+            logger.warning(f"Possible N+1 on {url_name or request.path}: {count}x {shape[:300]}")
+
+        if self.expose_headers:
+            response['X-Query-Count'] = str(tracker.count)
+            response['X-Query-Time-Ms'] = f"{tracker.duration * 1000:.1f}"
+            if repeated:
+                response['X-Query-Repeated'] = str(sum(repeated.values()))
+        return response
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Declarative row-level security for the generic endpoints.
+
+A RowPolicy maps each role (and anonymous callers) to a rule:
+
+- ALL: every row.
+- DENY: no row; list-style endpoints answer 403 without querying.
+- Owner('lookup'): rows whose `lookup` points at the requesting user.
+
+The role table is compiled once, indexed by the role bits from authentication.permissions,
+so resolving a request's rule is one dict lookup. The result is a Q object that views AND
+into their main query, so rows the caller may not see are never loaded. SUPER-ADMIN always
+gets ALL.
+"""
+from django.db.models import Q
+from authentication.permissions import ROLE_BITS, get_role_bits
+
+ALL = Q()
+DENY = None
+
+class Owner:
+    def __init__(self, lookup):
+        self.lookup = lookup
+
+    def compile(self, user):
+        return Q(**{self.lookup: user.pk})
+
+class RowPolicy:
+    def __init__(self, roles=None, default=ALL, anonymous=ALL):
+        roles = roles or {}
+        unknown = set(roles) - set(ROLE_BITS)
+        if unknown:
+            raise ValueError(f"Unknown roles in policy: {', '.join(sorted(unknown))}")
+        self.rules = {0: anonymous}
+        self.rules.update({bit: roles.get(role, default) for role, bit in ROLE_BITS.items()})
+        self.rules[ROLE_BITS['SUPER-ADMIN']] = ALL
+
+    def compile(self, request):
+        """
+        Q restricting a queryset to the rows the requester may see, or None (DENY).
+        """
+        rule = self.rules.get(get_role_bits(request.user), DENY)
+        if isinstance(rule, Owner):
+            return rule.compile(request.user) if request.user.is_authenticated else DENY
+        return rule
+
+def role_policy(*roles):
+    """
+    Whole table visible to the given roles (SUPER-ADMIN implied), hidden from everyone else.
+    """
+    return RowPolicy({role: ALL for role in roles}, default=DENY, anonymous=DENY)
+
+def owner_policy(lookup, bypass=()):
+    """
+    Rows visible to the user they belong to, and entirely to the `bypass` roles.
+    """
+    return RowPolicy({role: ALL for role in bypass}, default=Owner(lookup), anonymous=DENY)
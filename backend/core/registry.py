@@ -0,0 +1,135 @@
+"""
+Central registry of the tables exposed through the generic endpoints.
+
+TABLES declares, per table, the model, the filter grammar, the default ordering, the
+row-level policy, the credential fields that are never exposed and whether the table may be exported. CoreConfig.ready() resolves it once into TableSpec objects so every
+generic view does a single dict lookup per request.
+"""
+from django.apps import apps
+from core.filters import KEY, RANGE, EXACT, DEFAULT_ORDERING
+from core.serializers import register_model_serializers, get_model_serializer
+from core.policies import RowPolicy, role_policy, owner_policy
+
+TABLES = {
+    'user': {
+        'model': 'authentication.User',
+        'filters': {'id': KEY, 'email': KEY, 'username': KEY, 'profileName': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': role_policy('ADMIN'),
+    },
+    'profile': {
+        'model': 'authentication.Profile',
+        'filters': {'id': KEY, 'name': EXACT, 'createdDate': RANGE},
+        'policy': role_policy(),
+    },
+    'login': {
+        'model': 'authentication.Login',
+        'filters': {'id': KEY, 'userId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': role_policy('ADMIN'),
+        'hidden': ('passwordHash', 'token1', 'token2'),
+        'export': False,  # Password hashes
+    },
+    'session': {
+        'model': 'authentication.Session',
+        'filters': {'id': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': role_policy('ADMIN'),
+        'hidden': ('code',),
+        'export': False,  # Live session codes
+    },
+    'bankcard': {
+        'model': 'payments.BankCard',
+        'filters': {'id': KEY, 'userId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': owner_policy('userId'),
+    },
+    'product': {
+        'model': 'products.Product',
+        'filters': {'id': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': RowPolicy(),
+    },
+    'productitem': {
+        'model': 'products.ProductItem',
+        'filters': {'id': KEY, 'productId': KEY, 'shoppingCartId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': owner_policy('shoppingCartId__userId'),
+    },
+    'pricebook': {
+        'model': 'products.PriceBook',
+        'filters': {'id': KEY, 'productId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': RowPolicy(),
+    },
+    'shoppingcart': {
+        'model': 'orders.ShoppingCart',
+        'filters': {'id': KEY, 'userId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': owner_policy('userId'),
+    },
+    'case': {
+        'model': 'orders.Case',
+        'filters': {'id': KEY, 'accountId': KEY, 'createdDate': RANGE, 'status': EXACT, 'isActive': EXACT},
+        'policy': owner_policy('accountId', bypass=('ADMIN', 'MODERATOR')),
+    },
+    'notification': {
+        'model': 'notifications.Notification',
+        'filters': {'id': KEY, 'receiver': KEY, 'createdDate': RANGE, 'isRead': EXACT},
+        'policy': owner_policy('receiver'),
+    },
+    'recordtype': {
+        'model': 'records.RecordType',
+        'filters': {'id': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': RowPolicy(),
+    },
+    'address': {
+        'model': 'records.Address',
+        'filters': {'id': KEY, 'userId': KEY, 'createdDate': RANGE, 'isActive': EXACT},
+        'policy': owner_policy('userId'),
+    },
+}
+
+
+class TableSpec:
+    """
+    A resolved TABLES entry.
+    """
+    def __init__(self, name, model, serializer_class, filters, ordering, policy, hidden=(), exportable=True):
+        self.name = name
+        self.model = model
+        self.serializer_class = serializer_class
+        self.filters = filters
+        self.ordering = ordering
+        self.policy = policy
+        self.hidden = hidden
+        self.exportable = exportable
+
+    def get_row_filter(self, request):
+        """
+        Q restricting a query to the rows the user may see, or None when the user may not
+        read the table at all. Applied inside the main query for lists and details alike.
+        """
+        return self.policy.compile(request)
+
+class TableRegistry:
+    def __init__(self):
+        self._tables = {}
+
+    def build(self):
+        """
+        Resolve TABLES into TableSpec objects. Called once from CoreConfig.ready().
+        """
+        models = {name: apps.get_model(config['model']) for name, config in TABLES.items()}
+        register_model_serializers(models.values(), {models[name]: config['hidden'] for name, config in TABLES.items() if 'hidden' in config})
+        self._tables = {
+            name: TableSpec(
+                name, models[name], get_model_serializer(models[name]), config['filters'],
+                config.get('ordering', DEFAULT_ORDERING), config.get('policy', RowPolicy()),
+                config.get('hidden', ()), config.get('export', True)
+            )
+            for name, config in TABLES.items()
+        }
+
+    def get(self, table):
+        """
+        Return the TableSpec for a table name (case-insensitive), or None.
+        """
+        return self._tables.get(table.lower()) if isinstance(table, str) else None
+
+    def __iter__(self):
+        return iter(self._tables.values())
+
+table_registry = TableRegistry()
\ No newline at end of file
@@ -0,0 +1,45 @@
+from rest_framework.renderers import JSONRenderer, BaseRenderer
+from core.encoders import dumps, columnar, msgpack, msgpack_dumps, COLUMNAR_MEDIA_TYPE, MSGPACK_MEDIA_TYPE
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer using core.encoders.dumps; indented output (?indent / Accept parameter)
+    still goes through DRF's own encoder.
+    """
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+class ColumnarJSONRenderer(BaseRenderer):
+    """
+    JSON with every list of rows sent as {"columns": [...], "rows": [[...], ...]}.
+    """
+    media_type = COLUMNAR_MEDIA_TYPE
+    format = 'columnar'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return dumps(columnar(data))
+
+class MsgPackRenderer(BaseRenderer):
+    """
+    Columnar layout packed with MessagePack; degrades to columnar JSON without msgpack.
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+    format = 'msgpack'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if msgpack is None:
+            response = (renderer_context or {}).get('response')
+            if response is not None:
+                response['Content-Type'] = COLUMNAR_MEDIA_TYPE
+            return dumps(columnar(data))
+        return msgpack_dumps(columnar(data))
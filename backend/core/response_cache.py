@@ -0,0 +1,128 @@
+"""
+Read-through response cache for public, user-independent GET endpoints.
+
+Entries are keyed by view, sorted query string, response encoding and the cache version
+of every model the view reads; post_save/post_delete on one of those models bumps its
+version, which orphans every entry built from it. Versions are seeded from the clock, so
+one lost to eviction never repeats a number an older entry was stored under, and live in
+the cache all workers share (core.shared_cache), so any worker's write invalidates them. Each entry is kept for RESPONSE_CACHE_STALE_TIMEOUT seconds past
+its freshness window: once it goes stale a single request (holding a cache.add lock)
+rebuilds it while the others keep serving the stale copy, and a cold miss waits briefly
+for whoever holds the lock instead of piling onto the database.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+from django.http import HttpResponse
+from django.utils.http import urlencode, parse_http_date_safe
+from datetime import datetime, timezone
+from functools import wraps
+from core.conditional import is_not_modified, not_modified_response, set_validators
+from core.encoders import negotiate_encoding
+import hashlib
+import logging
+import time
+
+logger = logging.getLogger('core')
+
+CACHED_HEADERS = ('Content-Type', 'Vary')
+LOCK_POLL_INTERVAL = 0.05
+
+def _version_key(model):
+    return f"response-version:{model._meta.label_lower}"
+
+def bump_response_version(sender, **kwargs):
+    """
+    post_save/post_delete receiver invalidating every cached response built from the sender.
+    """
+    key = _version_key(sender)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, time.time_ns(), None)
+
+def connect_response_invalidation(models):
+    for model in models:
+        post_save.connect(bump_response_version, sender=model, dispatch_uid=f"response-version-save-{model._meta.label_lower}")
+        post_delete.connect(bump_response_version, sender=model, dispatch_uid=f"response-version-delete-{model._meta.label_lower}")
+
+def _model_versions(models):
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key, 0)
+    return [versions[key] for key in keys]
+
+def _cache_key(view, request, models):
+    query = urlencode(sorted((key, value) for key, values in request.GET.lists() for value in values))
+    fingerprint = hashlib.md5(f"{request.path}?{query}|{negotiate_encoding(request)}|{_model_versions(models)}".encode()).hexdigest()
+    return f"response:{type(view).__module__}.{type(view).__qualname__}:{fingerprint}"
+
+def _validators(response):
+    if not response.has_header('ETag'):
+        return None
+    last_modified = parse_http_date_safe(response.get('Last-Modified', ''))
+    return response['ETag'], datetime.fromtimestamp(last_modified, tz=timezone.utc) if last_modified else None
+
+def _store(key, response, timeout):
+    entry = {
+        'content': response.content,
+        'status': response.status_code,
+        'headers': {header: response[header] for header in CACHED_HEADERS if response.has_header(header)},
+        'validators': _validators(response),
+        'fresh_until': time.time() + timeout,
+    }
+    cache.set(key, entry, timeout + getattr(settings, 'RESPONSE_CACHE_STALE_TIMEOUT', 30))
+
+def _replay(request, entry):
+    validators = entry['validators']
+    if validators and is_not_modified(request, validators):
+        return not_modified_response(validators)
+    response = HttpResponse(entry['content'], status=entry['status'])
+    for header, value in entry['headers'].items():
+        response[header] = value
+    return set_validators(response, validators) if validators else response
+
+def cache_response(*models, timeout=None):
+    """
+    Cache a GET handler's 200 responses until one of `models` changes or `timeout` expires.
+    Only for endpoints that return the same data to every caller.
+    """
+    connect_response_invalidation(models)
+
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            ttl = timeout or getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 60)
+            lock_timeout = getattr(settings, 'RESPONSE_CACHE_LOCK_TIMEOUT', 10)
+            key = _cache_key(view, request, models)
+            lock_key = f"{key}:lock"
+
+            entry = cache.get(key)
+            if entry is not None and entry['fresh_until'] > time.time():
+                return _replay(request, entry)
+            if not cache.add(lock_key, 1, lock_timeout):
+                if entry is not None:
+                    return _replay(request, entry)
+                deadline = time.time() + getattr(settings, 'RESPONSE_CACHE_LOCK_WAIT', 1)
+                while time.time() < deadline:
+                    time.sleep(LOCK_POLL_INTERVAL)
+                    entry = cache.get(key)
+                    if entry is not None:
+                        return _replay(request, entry)
+                logger.warning(f"Timed out waiting for cached response {key}; rebuilding it")
+                return handler(view, request, *args, **kwargs)
+            try:
+                response = handler(view, request, *args, **kwargs)
+                if getattr(view, 'validators', None) is not None:
+                    # ConditionalMixin would only attach them after the entry is stored
+                    set_validators(response, view.validators)
+                if response.status_code == 200:
+                    _store(key, response, ttl)
+                return response
+            finally:
+                cache.delete(lock_key)
+        return wrapper
+    return decorator
@@ -1,13 +1,51 @@
 from rest_framework import serializers
-from django.apps import apps
+import copy
+
+class RegisteredModelSerializer(serializers.ModelSerializer):
+    """
+    Base class for the per-model serializers built by the registry.
+    Fields are introspected once per class and cloned for each instance.
+    """
+    _compiled_fields = None
 
-class DynamicModelSerializer(serializers.ModelSerializer):
     def __init__(self, *args, **kwargs):
-        model = kwargs.pop('model', None)
+        fields = kwargs.pop('fields', None)
         super().__init__(*args, **kwargs)
-        if model:
-            self.Meta.model = model
-            self.Meta.fields = '__all__'
+        if fields is not None:
+            # Sparse fieldset: drop every field the client did not ask for
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    def get_fields(self):
+        cls = type(self)
+        if cls._compiled_fields is None:
+            cls._compiled_fields = super().get_fields()
+        return copy.deepcopy(cls._compiled_fields)
+
+_serializer_registry = {}
+
+def build_model_serializer(model, hidden=()):
+    """
+    Build a serializer class exposing all fields of a model except the hidden ones.
+    """
+    meta = type('Meta', (), {'model': model, 'exclude': tuple(hidden)} if hidden else {'model': model, 'fields': '__all__'})
+    return type(f"{model.__name__}GeneralSerializer", (RegisteredModelSerializer,), {'Meta': meta})
+
+def register_model_serializers(models, hidden=None):
+    """
+    Build and compile one serializer class per model. Called once from CoreConfig.ready().
+    hidden maps a model to the fields its serializer must never read or write.
+    """
+    hidden = hidden or {}
+    for model in models:
+        serializer_class = build_model_serializer(model, hidden.get(model, ()))
+        serializer_class().get_fields()
+        _serializer_registry[model] = serializer_class
 
-    class Meta:
-        fields = '__all__'
\ No newline at end of file
+def get_model_serializer(model):
+    """
+    Return the registered serializer class for a model.
+    """
+    if model not in _serializer_registry:
+        register_model_serializers([model])
+    return _serializer_registry[model]
\ No newline at end of file
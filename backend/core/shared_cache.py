@@ -0,0 +1,26 @@
+"""
+Startup guard for the features that keep cross-request state in the default cache.
+
+Table versions (core.counts), the list ETags built from them (core.conditional) and the
+response cache (core.response_cache) assume every worker sees the same cache. With a
+process-local backend a write handled by one worker never reaches the others, which would
+keep answering 304 or serving cached responses for data that changed. CoreConfig.ready()
+calls require_shared_cache(), so such a deployment fails at startup instead.
+CACHE_ALLOW_PROCESS_LOCAL opts out for single-process servers (runserver, tests).
+"""
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+def require_shared_cache():
+    backend = settings.CACHES['default']['BACKEND']
+    if backend in PROCESS_LOCAL_BACKENDS and not getattr(settings, 'CACHE_ALLOW_PROCESS_LOCAL', False):
+        raise ImproperlyConfigured(
+            f"The default cache ({backend}) is local to each process, but list ETags, cached counts "
+            "and cached responses need a cache shared by all workers. Configure a shared backend "
+            "(e.g. REDIS_URL) or set CACHE_ALLOW_PROCESS_LOCAL for a single-process server."
+        )
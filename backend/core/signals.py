@@ -1,32 +1,47 @@
-from django.db.models.signals import pre_save
-from django.dispatch import receiver
 from django.apps import apps
+from django.db.models.signals import pre_save
 from django_currentuser.middleware import get_current_user
 
-@receiver(pre_save)
+# Apps whose models carry audit fields
+AUDIT_APPS = ['authentication', 'payments', 'products', 'orders', 'notifications', 'records']
+AUDIT_FIELDS = ('createdById', 'lastModifiedById', 'createdDate', 'lastModifiedDate')
+
+# model -> (createdById attname, lastModifiedById attname, user model), filled by connect_audit_stamping()
+AUDIT_FIELD_MAP = {}
+
+def audit_user(model):
+    """
+    Primary key of the authenticated user to stamp on `model`, or None.
+    """
+    created, modified, user_model = AUDIT_FIELD_MAP[model]
+    user = get_current_user()
+    # Admin and other non-API requests carry a django.contrib.auth user, which cannot be stamped
+    if isinstance(user, user_model):
+        return user.pk
+    return None
+
 def set_audit_fields(sender, instance, **kwargs):
     """
     Auto-fill createdById and lastModifiedById based on the authenticated user.
-    Applies to all models with audit fields.
+    createdDate and lastModifiedDate are handled by auto_now_add and auto_now.
     """
-    # List of apps to apply this signal to
-    applicable_apps = ['authentication', 'payments', 'products', 'orders', 'notifications', 'records']
-
-    # Check if the sender's app is in the applicable list
-    app_label = sender._meta.app_label
-    if app_label not in applicable_apps:
-        return
-
-    # Check if the instance has audit fields
-    has_audit_fields = all(hasattr(instance, field) for field in ['createdById', 'lastModifiedById', 'createdDate', 'lastModifiedDate'])
-    if not has_audit_fields:
+    user_id = audit_user(sender)
+    if user_id is None:
         return
+    created, modified, _ = AUDIT_FIELD_MAP[sender]
+    if instance._state.adding and getattr(instance, created) is None:
+        setattr(instance, created, user_id)
+    setattr(instance, modified, user_id)
 
-    # Get the current user
-    user = get_current_user()
-    if user and not user.is_anonymous:
-        if instance.pk is None:  # New instance
-            if not instance.createdById:
-                instance.createdById = user
-        instance.lastModifiedById = user
-    # Note: createdDate and lastModifiedDate are handled by auto_now_add and auto_now
\ No newline at end of file
+def connect_audit_stamping():
+    """
+    Register set_audit_fields only on models that have every audit field. Called once from CoreConfig.ready().
+    """
+    for app_label in AUDIT_APPS:
+        for model in apps.get_app_config(app_label).get_models():
+            field_names = {field.name for field in model._meta.get_fields()}
+            if not all(field in field_names for field in AUDIT_FIELDS):
+                continue
+            created, modified = model._meta.get_field('createdById'), model._meta.get_field('lastModifiedById')
+            AUDIT_FIELD_MAP[model] = (created.attname, modified.attname, created.related_model)
+            pre_save.connect(set_audit_fields, sender=model, dispatch_uid=f"audit-fields-{model._meta.label_lower}")
@@ -0,0 +1,117 @@
+"""
+Token-bucket throttling shared by every worker process on a host.
+
+Buckets live in a small memory-mapped file (THROTTLE_STORE_PATH) laid out as an
+open-addressed table of (key hash, tokens, updated) slots, guarded by a thread lock plus
+an flock, so a check is a hash, a few struct reads and two lock calls. When a probe window
+is full the least recently updated bucket is evicted, which at worst forgets a client's
+debt. Platforms without fcntl fall back to a per-process table.
+
+Buckets are keyed by view class and client (user id, else IP). Rates come from
+THROTTLE_RATES by the view's throttle_scope, falling back to 'default'.
+"""
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+SLOT = struct.Struct('<Qdd')  # key hash, tokens, last update
+PROBES = 8
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+def parse_rate(rate):
+    """
+    '10/min' -> (capacity 10, refill of 10 tokens per 60 seconds).
+    """
+    count, period = rate.split('/')
+    return int(count), int(count) / PERIODS[period[0]]
+
+class BucketStore:
+    def __init__(self, path, slots):
+        self.path = path
+        self.slots = slots
+        self.lock = threading.Lock()
+        self.pid = None
+        self.buffer = None
+        self.fd = None
+
+    def open(self):
+        # Each process opens its own descriptor: flock does not exclude holders of an inherited one
+        if self.pid == os.getpid():
+            return
+        size = self.slots * SLOT.size
+        if fcntl is None:
+            self.buffer = bytearray(size)
+        else:
+            self.fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            if os.fstat(self.fd).st_size < size:
+                os.ftruncate(self.fd, size)
+            self.buffer = mmap.mmap(self.fd, size)
+        self.pid = os.getpid()
+
+    def consume(self, key, capacity, refill):
+        """
+        Take one token from the bucket for `key`. Returns 0 when allowed, else seconds to wait.
+        """
+        digest = int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little') or 1
+        start = digest % self.slots
+        now = time.time()
+        with self.lock:
+            self.open()
+            if self.fd is not None:
+                fcntl.flock(self.fd, fcntl.LOCK_EX)
+            try:
+                target, oldest, oldest_time, tokens = None, None, None, capacity
+                for probe in range(PROBES):
+                    offset = ((start + probe) % self.slots) * SLOT.size
+                    slot_key, slot_tokens, updated = SLOT.unpack_from(self.buffer, offset)
+                    if slot_key == digest:
+                        target, tokens = offset, min(capacity, slot_tokens + (now - updated) * refill)
+                        break
+                    if slot_key == 0 and target is None:
+                        target = offset
+                    if oldest_time is None or updated < oldest_time:
+                        oldest, oldest_time = offset, updated
+                if target is None:
+                    target = oldest
+                if tokens < 1:
+                    SLOT.pack_into(self.buffer, target, digest, tokens, now)
+                    return (1 - tokens) / refill
+                SLOT.pack_into(self.buffer, target, digest, tokens - 1, now)
+                return 0
+            finally:
+                if self.fd is not None:
+                    fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+bucket_store = BucketStore(
+    getattr(settings, 'THROTTLE_STORE_PATH', None) or os.path.join(tempfile.gettempdir(), 'backend-throttle.bin'),
+    getattr(settings, 'THROTTLE_STORE_SLOTS', 65536),
+)
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    DRF throttle backed by bucket_store; set `throttle_scope` on a view to pick its rate.
+    """
+    def allow_request(self, request, view):
+        rates = getattr(settings, 'THROTTLE_RATES', {})
+        rate = rates.get(getattr(view, 'throttle_scope', None)) or rates.get('default')
+        if not rate:
+            return True
+        capacity, refill = parse_rate(rate)
+        user = request.user
+        client = f"user:{user.pk}" if getattr(user, 'is_authenticated', False) else f"ip:{self.get_ident(request)}"
+        self.delay = bucket_store.consume(f"{type(view).__name__}:{client}", capacity, refill)
+        return self.delay == 0
+
+    def wait(self):
+        return self.delay
@@ -1,7 +1,10 @@
 from django.urls import path, re_path
-from core.views import GeneralListView, GeneralDetailView
+from core.views import GeneralListView, GeneralDetailView, GeneralBatchDetailView, GeneralExportView, GeneralAggregateView
 
 urlpatterns = [
     re_path(r'^(?P<table>\w+)(?:\((?P<page>\d+)\))?/listview$', GeneralListView.as_view(), name='general-listview'),
     re_path(r'^(?P<table>\w+)\((?P<id>[-\w]+)\)/detail$', GeneralDetailView.as_view(), name='general-detail'),
+    re_path(r'^(?P<table>\w+)/export$', GeneralExportView.as_view(), name='general-export'),
+    re_path(r'^(?P<table>\w+)/aggregate$', GeneralAggregateView.as_view(), name='general-aggregate'),
+    path('batch/detail', GeneralBatchDetailView.as_view(), name='general-batch-detail'),
 ]
\ No newline at end of file
@@ -1,24 +1,109 @@
-from django.http import JsonResponse
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
 from rest_framework import status
-import uuid
-from django.db import transaction, IntegrityError
+from functools import partial
+import json
+import base64
+import os
+import secrets
+import threading
+import time
+from django.db.models import Q
+from core.encoders import dumps, negotiate_encoding, columnar, msgpack_dumps, ENCODINGS
 
-def generate_unique_id(prefix="USR", model=None, field="id"):
+CURSOR_ORDERING = ('-createdDate', '-id')
+
+# Crockford base32: no I, L, O or U, and ASCII order matches numeric order
+ID_ALPHABET = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+ID_LENGTH = 16  # 80 bits: 48-bit millisecond timestamp, 16-bit node, 16-bit sequence
+SEQUENCE_BITS = 16
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+_id_lock = threading.Lock()
+_id_state = {'node': secrets.randbits(16), 'millis': 0, 'sequence': 0}
+
+def _reseed_node():
+    # A forked worker must not share its parent's node bits
+    _id_state.update(node=secrets.randbits(16), millis=0, sequence=0)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_node)
+
+def _encode_id(value):
+    chars = []
+    for _ in range(ID_LENGTH):
+        value, index = divmod(value, 32)
+        chars.append(ID_ALPHABET[index])
+    return ''.join(reversed(chars))
+
+def _reserve_sequences(count):
+    """
+    Reserve `count` consecutive (millis, sequence) slots, moving to the next millisecond when
+    one fills up. The clock never goes backwards from the generator's point of view.
+    """
+    slots = []
+    with _id_lock:
+        while len(slots) < count:
+            now = max(time.time_ns() // 1_000_000, _id_state['millis'])
+            if now > _id_state['millis']:
+                # Random start in the lower half leaves room for at least 32768 IDs per millisecond
+                _id_state.update(millis=now, sequence=secrets.randbits(SEQUENCE_BITS - 1))
+            elif _id_state['sequence'] >= MAX_SEQUENCE:
+                _id_state.update(millis=now + 1, sequence=secrets.randbits(SEQUENCE_BITS - 1))
+            else:
+                _id_state['sequence'] += 1
+            take = min(count - len(slots), MAX_SEQUENCE - _id_state['sequence'] + 1)
+            slots.extend((_id_state['millis'], _id_state['sequence'] + offset) for offset in range(take))
+            _id_state['sequence'] += take - 1
+        node = _id_state['node']
+    return [(millis << 32) | (node << SEQUENCE_BITS) | sequence for millis, sequence in slots]
+
+def generate_unique_id(prefix="USR"):
+    """
+    Generate a time-ordered ID such as PRD-01HF3Z8K2M7Q4R5T without touching the database.
+    IDs from one process are strictly increasing; across processes they sort by millisecond.
+    """
+    return f"{prefix}-{_encode_id(_reserve_sequences(1)[0])}"
+
+def allocate_unique_ids(prefix, count):
+    """
+    Allocate a block of `count` increasing IDs in one step, e.g. for bulk_create.
+    """
+    return [f"{prefix}-{_encode_id(value)}" for value in _reserve_sequences(count)]
+
+def unique_id_default(prefix):
     """
-    Generate a unique ID with a prefix.
+    Callable field default (serializable by migrations) producing a fresh ID per instance.
     """
-    max_attempts = 5
-    for _ in range(max_attempts):
-        unique_id = f"{prefix}-{uuid.uuid4().hex[:8]}"  # Shortened for readability
-        if model and hasattr(model, 'objects') and not model.objects.filter(**{field: unique_id}).exists():
-            return unique_id
-        elif not model:
-            return unique_id
-    raise IntegrityError(f"Failed to generate unique ID with prefix {prefix} after {max_attempts} attempts")
+    return partial(generate_unique_id, prefix)
 
-def api_response(data=None, message="Success", status_code=status.HTTP_200_OK, errors=None):
+def resolve_projection(model, fields=None, exclude=None, hidden=()):
+    """
+    Resolve a sparse fieldset request into the list of concrete model fields to load and serialize.
+    Accepts lists or comma-separated strings. Returns None when no projection was requested.
+    Hidden fields are treated as unknown.
+    """
+    if fields and exclude:
+        raise ValueError("Use either 'fields' or 'exclude', not both")
+    if not fields and not exclude:
+        return None
+    requested = fields or exclude
+    if isinstance(requested, str):
+        requested = [name.strip() for name in requested.split(',') if name.strip()]
+    if not isinstance(requested, (list, tuple)):
+        raise ValueError("'fields' and 'exclude' must be a list of field names")
+    available = [field.name for field in model._meta.concrete_fields if field.name not in hidden]
+    unknown = [name for name in requested if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(map(str, unknown))}")
+    if fields:
+        return [name for name in available if name in requested]
+    return [name for name in available if name not in requested]
+
+def api_response(data=None, message="Success", status_code=status.HTTP_200_OK, errors=None, request=None):
     """
     Standardize API responses across the project.
+    Pass the request from list endpoints to honour the columnar/msgpack encodings.
     """
     response = {
         "status": "success" if status_code < 400 else "error",
@@ -27,19 +112,93 @@ def api_response(data=None, message="Success", status_code=status.HTTP_200_OK, e
     }
     if errors:
         response["errors"] = errors
-    return JsonResponse(response, status=status_code)
+    encoding = negotiate_encoding(request) if request is not None and status_code < 400 else 'json'
+    if encoding == 'json':
+        http_response = HttpResponse(dumps(response), content_type='application/json', status=status_code)
+    else:
+        response["data"] = columnar(response["data"])
+        content = msgpack_dumps(response) if encoding == 'msgpack' else dumps(response)
+        http_response = HttpResponse(content, content_type=ENCODINGS[encoding], status=status_code)
+    if request is not None:
+        # Every encoding of a negotiated URL, JSON included, depends on Accept
+        patch_vary_headers(http_response, ('Accept',))
+    return http_response
 
-def paginate_queryset(queryset, request, page_size=10):
+def paginate_queryset(queryset, request, page_size=10, ordering=None, count_strategy=None):
     """
     Paginate a queryset based on request parameters.
+    Pass ?pagination=cursor (or follow a `next` link carrying a cursor) to switch to keyset pagination.
+    The total count follows count_strategy, defaulting to the strategy configured for the model.
     """
+    if request.query_params.get('pagination') == 'cursor' or 'cursor' in request.query_params:
+        return cursor_paginate_queryset(queryset, request, page_size=page_size, ordering=ordering or CURSOR_ORDERING)
+    if ordering:
+        queryset = queryset.order_by(*ordering)
     from rest_framework.pagination import PageNumberPagination
+    from core.counts import CountStrategyPaginator, get_count_strategy
     paginator = PageNumberPagination()
     paginator.page_size = page_size
+    paginator.django_paginator_class = partial(
+        CountStrategyPaginator, count_strategy=count_strategy or get_count_strategy(queryset.model)
+    )
     page = paginator.paginate_queryset(queryset, request)
     return {
         "results": page,
         "count": paginator.page.paginator.count,
         "next": paginator.get_next_link(),
         "previous": paginator.get_previous_link(),
+    }
+
+def encode_cursor(instance, ordering=CURSOR_ORDERING):
+    """
+    Build an opaque cursor from the ordering fields of the last row of a page.
+    """
+    model_meta = instance._meta
+    position = [model_meta.get_field(name.lstrip('-')).value_to_string(instance) for name in ordering]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+def decode_cursor(cursor, model, ordering=CURSOR_ORDERING):
+    """
+    Turn a cursor back into typed values for the ordering fields.
+    Raises ValueError if the cursor was not produced by encode_cursor.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(position, list) or len(position) != len(ordering):
+        raise ValueError("Invalid cursor")
+    return [model._meta.get_field(name.lstrip('-')).to_python(value) for name, value in zip(ordering, position)]
+
+def cursor_paginate_queryset(queryset, request, page_size=10, ordering=CURSOR_ORDERING):
+    """
+    Keyset pagination on (createdDate, id): no COUNT query and no OFFSET scan,
+    so every page costs the same as the first one.
+    """
+    from rest_framework.exceptions import ParseError
+    from rest_framework.utils.urls import replace_query_param
+    lookup = 'lt' if ordering[0].startswith('-') else 'gt'
+    queryset = queryset.order_by(*ordering)
+    cursor = request.query_params.get('cursor')
+    if cursor:
+        try:
+            values = decode_cursor(cursor, queryset.model, ordering)
+        except Exception:
+            raise ParseError("Invalid cursor")
+        (first, first_value), (second, second_value) = zip([name.lstrip('-') for name in ordering], values)
+        # The leading range predicate keeps the scan on the (createdDate, id) index.
+        queryset = queryset.filter(
+            Q(**{f"{first}__{lookup}e": first_value}),
+            Q(**{f"{first}__{lookup}": first_value}) | Q(**{f"{second}__{lookup}": second_value}),
+        )
+    rows = list(queryset[:page_size + 1])
+    next_link = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        next_link = replace_query_param(request.build_absolute_uri(), 'cursor', encode_cursor(rows[-1], ordering))
+    return {
+        "results": rows,
+        "count": None,
+        "next": next_link,
+        "previous": None,
     }
\ No newline at end of file
@@ -1,108 +1,137 @@
 from rest_framework.views import APIView
 from rest_framework import status
+from rest_framework.exceptions import ParseError, Throttled, NotAuthenticated, AuthenticationFailed, PermissionDenied
 from rest_framework.permissions import AllowAny
-from rest_framework.authentication import TokenAuthentication
-from django.apps import apps
-from core.serializers import DynamicModelSerializer
-from core.utils import api_response, paginate_queryset
-from authentication.permissions import IsSuperAdmin, IsAdmin, IsModerator, IsUser
+from authentication.authentication import JWTAuthentication
+from authentication.permissions import IsAdmin
+from django.http import StreamingHttpResponse
+from core.registry import table_registry
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
+from core.utils import api_response, paginate_queryset, resolve_projection
+from core.export import EXPORT_FORMATS, export_rows
+from core.filters import compile_filters, compile_aggregates, resolve_ordering, resolve_page_size, check_offset, MAX_GROUPS
 import logging
+import math
 
 logger = logging.getLogger('core')
 
+def apply_projection(queryset, projection):
+    """
+    Narrow the SELECT to the projected columns, plus the ordering column and the one the
+    detail validators read.
+    """
+    if projection is None:
+        return queryset
+    return queryset.only(*set(projection) | {'createdDate', 'lastModifiedDate'})
+
 class BaseAPIView(APIView):
+    throttle_scope = 'generic'
+
     def handle_exception(self, exc):
+        if isinstance(exc, Throttled):
+            logger.warning(f"Throttled {self.__class__.__name__}: retry in {exc.wait}s")
+            response = api_response(message="Too many requests", status_code=status.HTTP_429_TOO_MANY_REQUESTS, errors={"detail": str(exc.detail)})
+            if exc.wait is not None:
+                response['Retry-After'] = str(math.ceil(exc.wait))
+            return response
+        if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+            # Missing, invalid or expired token: 401 tells the client to authenticate again
+            logger.warning(f"Authentication failed in {self.__class__.__name__}: {str(exc)}")
+            response = api_response(message="Authentication required", status_code=status.HTTP_401_UNAUTHORIZED, errors={"detail": str(exc.detail)})
+            response['WWW-Authenticate'] = self.get_authenticate_header(self.request) or 'Bearer'
+            return response
+        if isinstance(exc, PermissionDenied):
+            logger.warning(f"Access denied in {self.__class__.__name__}: {str(exc)}")
+            return api_response(message="Permission denied", status_code=exc.status_code, errors={"detail": str(exc.detail)})
         logger.error(f"Exception in {self.__class__.__name__}: {str(exc)}")
         return api_response(message=str(exc), status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(exc)})
 
-class GeneralListView(BaseAPIView):
-    authentication_classes = [TokenAuthentication]
+class GeneralListView(ConditionalMixin, BaseAPIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def post(self, request, table, page=None):
         try:
-            model_map = {
-                'user': 'authentication.User', 'profile': 'authentication.Profile', 'login': 'authentication.Login',
-                'session': 'authentication.Session', 'bankcard': 'payments.BankCard', 'product': 'products.Product',
-                'productitem': 'products.ProductItem', 'pricebook': 'products.PriceBook', 'shoppingcart': 'orders.ShoppingCart',
-                'case': 'orders.Case', 'notification': 'notifications.Notification', 'recordtype': 'records.RecordType',
-                'address': 'records.Address'
-            }
-            if table.lower() not in model_map:
+            spec = table_registry.get(table)
+            if spec is None:
                 logger.warning(f"Invalid table name: {table}")
                 return api_response(message="Invalid table name", status_code=status.HTTP_400_BAD_REQUEST)
 
-            model = apps.get_model(model_map[table.lower()])
-            filters = request.data.get('filters', {})
-            queryset = model.objects.all()
-
-            # Apply permission-based filtering
-            if not request.user.is_authenticated or request.user.profileName.name != "SUPER-ADMIN":
-                if table.lower() == 'user' and not IsAdmin().has_permission(request, self):
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'profile' and not IsSuperAdmin().has_permission(request, self):
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() in ['shoppingcart', 'notification']:
-                    key = 'userId' if table.lower() == 'shoppingcart' else 'receiver'
-                    filters[key] = request.user
-                elif table.lower() == 'productitem':
-                    filters['shoppingCartId__userId'] = request.user
-                elif table.lower() == 'case' and not IsModerator().has_permission(request, self):
-                    filters['accountId'] = request.user
+            model = spec.model
+            try:
+                lookups = compile_filters(spec.filters, request.data.get('filters', {}))
+                ordering = resolve_ordering(request.data.get('ordering'), spec.ordering)
+                page_size = resolve_page_size(request.data.get('page_size'))
+                check_offset(request.query_params.get('page'), page_size)
+            except ValueError as e:
+                logger.warning(f"Invalid filter parameters for {table}: {str(e)}")
+                return api_response(message="Invalid filter parameters", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+            try:
+                projection = resolve_projection(model, request.data.get('fields'), request.data.get('exclude'), spec.hidden)
+            except ValueError as e:
+                logger.warning(f"Invalid field projection for {table}: {str(e)}")
+                return api_response(message="Invalid field projection", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+            queryset = apply_projection(model.objects.all(), projection)
+
+            # Row-level policy, applied inside the same query
+            row_filter = spec.get_row_filter(request)
+            if row_filter is None:
+                return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
 
             try:
-                queryset = queryset.filter(**filters)
+                queryset = queryset.filter(row_filter, **lookups)
             except Exception as e:
                 logger.error(f"Invalid filter parameters for {table}: {str(e)}")
                 return api_response(message="Invalid filter parameters", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
 
-            paginated_data = paginate_queryset(queryset, request)
-            serializer = DynamicModelSerializer(paginated_data['results'], many=True, model=model)
-            logger.info(f"Retrieved list for {table} with {paginated_data['count']} items")
+            not_modified = self.not_modified(request, queryset_validators(request, queryset))
+            if not_modified:
+                return not_modified
+
+            try:
+                paginated_data = paginate_queryset(queryset, request, page_size=page_size, ordering=ordering)
+            except ParseError as e:
+                logger.warning(f"Invalid pagination parameters for {table}: {str(e)}")
+                return api_response(message="Invalid pagination parameters", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+            serializer = spec.serializer_class(paginated_data['results'], many=True, fields=projection)
+            logger.info(f"Retrieved list for {table} with {len(serializer.data)} items")
             return api_response(
                 data={"results": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-                message=f"{table.capitalize()} list retrieved successfully"
+                message=f"{table.capitalize()} list retrieved successfully",
+                request=request
             )
         except Exception as e:
             logger.error(f"Error retrieving list for {table}: {str(e)}")
             return api_response(message="Error retrieving list", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
 
-class GeneralDetailView(BaseAPIView):
-    authentication_classes = [TokenAuthentication]
+class GeneralDetailView(ConditionalMixin, BaseAPIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def post(self, request, table, id):
         try:
-            model_map = {
-                'user': 'authentication.User', 'profile': 'authentication.Profile', 'login': 'authentication.Login',
-                'session': 'authentication.Session', 'bankcard': 'payments.BankCard', 'product': 'products.Product',
-                'productitem': 'products.ProductItem', 'pricebook': 'products.PriceBook', 'shoppingcart': 'orders.ShoppingCart',
-                'case': 'orders.Case', 'notification': 'notifications.Notification', 'recordtype': 'records.RecordType',
-                'address': 'records.Address'
-            }
-            if table.lower() not in model_map:
+            spec = table_registry.get(table)
+            if spec is None:
                 logger.warning(f"Invalid table name: {table}")
                 return api_response(message="Invalid table name", status_code=status.HTTP_400_BAD_REQUEST)
 
-            model = apps.get_model(model_map[table.lower()])
-            instance = model.objects.get(id=id)
-
-            # Permission checks
-            if request.user.is_authenticated and request.user.profileName.name != "SUPER-ADMIN":
-                if table.lower() == 'user' and not IsAdmin().has_permission(request, self):
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'profile':
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'shoppingcart' and instance.userId != request.user:
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'notification' and instance.receiver != request.user:
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'productitem' and instance.shoppingCartId.userId != request.user:
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-                elif table.lower() == 'case' and not IsModerator().has_permission(request, self) and instance.accountId != request.user:
-                    return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
-
-            serializer = DynamicModelSerializer(instance, model=model)
+            model = spec.model
+            try:
+                projection = resolve_projection(model, request.data.get('fields'), request.data.get('exclude'), spec.hidden)
+            except ValueError as e:
+                logger.warning(f"Invalid field projection for {table}: {str(e)}")
+                return api_response(message="Invalid field projection", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+            row_filter = spec.get_row_filter(request)
+            if row_filter is None:
+                return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            # Rows outside the policy are indistinguishable from missing ones
+            instance = apply_projection(model.objects.all(), projection).filter(row_filter).get(id=id)
+
+            not_modified = self.not_modified(request, instance_validators(request, instance))
+            if not_modified:
+                return not_modified
+
+            serializer = spec.serializer_class(instance, fields=projection)
             logger.info(f"Retrieved detail for {table} with id {id}")
             return api_response(data=serializer.data, message=f"{table.capitalize()} detail retrieved successfully")
         except model.DoesNotExist:
@@ -110,4 +139,150 @@ class GeneralDetailView(BaseAPIView):
             return api_response(message=f"{table.capitalize()} not found", status_code=status.HTTP_404_NOT_FOUND)
         except Exception as e:
             logger.error(f"Error retrieving detail for {table} with id {id}: {str(e)}")
-            return api_response(message="Error retrieving detail", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
\ No newline at end of file
+            return api_response(message="Error retrieving detail", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
+
+class GeneralBatchDetailView(BaseAPIView):
+    """
+    Resolve many (table, id) pairs in one request, with one id__in query per table.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [AllowAny]
+    max_items = 100
+
+    def post(self, request):
+        try:
+            items = request.data.get('items', [])
+            if not isinstance(items, list) or not items:
+                return api_response(message="'items' must be a non-empty list", status_code=status.HTTP_400_BAD_REQUEST)
+            if len(items) > self.max_items:
+                return api_response(message=f"At most {self.max_items} items are allowed", status_code=status.HTTP_400_BAD_REQUEST)
+
+            pairs = []
+            for item in items:
+                if isinstance(item, dict):
+                    table, id = item.get('table'), item.get('id')
+                elif isinstance(item, (list, tuple)) and len(item) == 2:
+                    table, id = item
+                else:
+                    table, id = None, None
+                if table_registry.get(table) is None or not id:
+                    logger.warning(f"Invalid batch item: {item}")
+                    return api_response(message="Invalid batch item", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(item)})
+                pairs.append((table.lower(), str(id)))
+
+            ids_by_table = {}
+            for table, id in pairs:
+                ids_by_table.setdefault(table, set()).add(id)
+
+            rows = {}
+            for table, ids in ids_by_table.items():
+                spec = table_registry.get(table)
+                row_filter = spec.get_row_filter(request)
+                if row_filter is None:
+                    rows.update({(table, id): None for id in ids})
+                    continue
+                instances = list(spec.model.objects.filter(row_filter, id__in=ids))
+                serializer = spec.serializer_class(instances, many=True)
+                for instance, data in zip(instances, serializer.data):
+                    rows[(table, instance.pk)] = data
+
+            results = []
+            for table, id in pairs:
+                if (table, id) not in rows:
+                    results.append({"table": table, "id": id, "status": status.HTTP_404_NOT_FOUND, "data": None})
+                elif rows[(table, id)] is None:
+                    results.append({"table": table, "id": id, "status": status.HTTP_403_FORBIDDEN, "data": None})
+                else:
+                    results.append({"table": table, "id": id, "status": status.HTTP_200_OK, "data": rows[(table, id)]})
+
+            logger.info(f"Retrieved batch detail for {len(pairs)} items across {len(ids_by_table)} tables")
+            return api_response(data={"results": results}, message="Batch detail retrieved successfully")
+        except Exception as e:
+            logger.error(f"Error retrieving batch detail: {str(e)}")
+            return api_response(message="Error retrieving batch detail", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
+
+class GeneralExportView(BaseAPIView):
+    """
+    Stream a whole table, after row filters, as NDJSON or CSV. Admins only; tables holding
+    credentials are not exportable.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAdmin]
+
+    def post(self, request, table):
+        try:
+            spec = table_registry.get(table)
+            if spec is None:
+                logger.warning(f"Invalid table name: {table}")
+                return api_response(message="Invalid table name", status_code=status.HTTP_400_BAD_REQUEST)
+            if not spec.exportable:
+                logger.warning(f"Export refused for {table}")
+                return api_response(message=f"{table.capitalize()} cannot be exported", status_code=status.HTTP_403_FORBIDDEN)
+
+            model = spec.model
+            export_format = request.data.get('format', 'ndjson')
+            if export_format not in EXPORT_FORMATS:
+                return api_response(message=f"Format must be one of: {', '.join(EXPORT_FORMATS)}", status_code=status.HTTP_400_BAD_REQUEST)
+            try:
+                lookups = compile_filters(spec.filters, request.data.get('filters', {}))
+                projection = resolve_projection(model, request.data.get('fields'), request.data.get('exclude'), spec.hidden)
+            except ValueError as e:
+                logger.warning(f"Invalid export parameters for {table}: {str(e)}")
+                return api_response(message="Invalid export parameters", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+
+            row_filter = spec.get_row_filter(request)
+            if row_filter is None:
+                return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            queryset = apply_projection(model.objects.filter(row_filter, **lookups), projection)
+
+            logger.info(f"Streaming {export_format} export of {table}")
+            response = StreamingHttpResponse(
+                export_rows(queryset, spec.serializer_class, export_format, fields=projection),
+                content_type=EXPORT_FORMATS[export_format]
+            )
+            response['Content-Disposition'] = f'attachment; filename="{table.lower()}.{export_format}"'
+            return response
+        except Exception as e:
+            logger.error(f"Error exporting {table}: {str(e)}")
+            return api_response(message="Error exporting table", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
+
+class GeneralAggregateView(BaseAPIView):
+    """
+    Run a single GROUP BY query over a table, after row filters.
+    """
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [AllowAny]
+
+    def post(self, request, table):
+        try:
+            spec = table_registry.get(table)
+            if spec is None:
+                logger.warning(f"Invalid table name: {table}")
+                return api_response(message="Invalid table name", status_code=status.HTTP_400_BAD_REQUEST)
+
+            model = spec.model
+            try:
+                lookups = compile_filters(spec.filters, request.data.get('filters', {}))
+                group_by, expressions = compile_aggregates(model, spec.filters, request.data.get('group_by'), request.data.get('aggregates'), spec.hidden)
+            except ValueError as e:
+                logger.warning(f"Invalid aggregate parameters for {table}: {str(e)}")
+                return api_response(message="Invalid aggregate parameters", status_code=status.HTTP_400_BAD_REQUEST, errors={"detail": str(e)})
+
+            row_filter = spec.get_row_filter(request)
+            if row_filter is None:
+                return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            queryset = model.objects.filter(row_filter, **lookups)
+
+            if group_by:
+                rows = list(queryset.values(*group_by).annotate(**expressions).order_by(*group_by)[:MAX_GROUPS + 1])
+            else:
+                rows = [queryset.aggregate(**expressions)]
+            truncated = len(rows) > MAX_GROUPS
+            logger.info(f"Aggregated {table} by {group_by} into {min(len(rows), MAX_GROUPS)} groups")
+            return api_response(
+                data={"results": rows[:MAX_GROUPS], "truncated": truncated},
+                message=f"{table.capitalize()} aggregate retrieved successfully"
+            )
+        except Exception as e:
+            logger.error(f"Error aggregating {table}: {str(e)}")
+            return api_response(message="Error aggregating table", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, errors={"detail": str(e)})
\ No newline at end of file
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:58
+
+import core.utils
+from django.db import migrations, models
+import functools
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_created_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='notification',
+            name='id',
+            field=models.CharField(default=functools.partial(core.utils.generate_unique_id, *('NTF',), **{}), max_length=20, primary_key=True, serialize=False),
+        ),
+    ]
@@ -1,9 +1,10 @@
 from django.db import models
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from authentication.models import User
 
 class Notification(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("NTF"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("NTF"))
     message = models.TextField()
     image = models.BinaryField(null=True, blank=True)
     receiver = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
@@ -15,11 +16,17 @@ class Notification(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("NTF", Notification)
+            self.id = generate_unique_id("NTF")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Notification {self.id} for {self.receiver.username}"
 
+    objects = AuditManager()
+
     class Meta:
-        db_table = 'Notifications'
\ No newline at end of file
+        db_table = 'Notifications'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='notification_created_idx'),
+            models.Index(fields=['receiver', 'createdDate', 'id'], name='notification_receiver_idx'),
+        ]
\ No newline at end of file
@@ -1,37 +1,42 @@
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import AllowAny
-from authentication.permissions import IsAdmin, IsUser
+from authentication.authentication import JWTAuthentication
+from authentication.permissions import IsSuperAdmin, IsAdmin, IsUser
 from notifications.models import Notification
 from notifications.serializers import NotificationSerializer
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
 from core.utils import api_response, paginate_queryset
 import logging
 
 logger = logging.getLogger('notifications')
 
-class NotificationListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class NotificationListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request):
         if request.user.is_authenticated:
-            if request.user.profileName.name == "SUPER-ADMIN":
+            if IsSuperAdmin().has_permission(request, self):
                 notifications = Notification.objects.all()
             else:
                 notifications = Notification.objects.filter(receiver=request.user)
+            not_modified = self.not_modified(request, queryset_validators(request, notifications))
+            if not_modified:
+                return not_modified
             paginated_data = paginate_queryset(notifications, request)
             serializer = NotificationSerializer(paginated_data['results'], many=True)
             logger.info(f"Retrieved {paginated_data['count']} notifications for {request.user.username}")
             return api_response(
                 data={"notifications": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-                message="Notifications retrieved successfully"
+                message="Notifications retrieved successfully",
+                request=request
             )
         logger.warning("Unauthenticated user attempted to access notifications")
         return api_response(message="Authentication required", status_code=status.HTTP_401_UNAUTHORIZED)
 
     def post(self, request):
-        if not request.user.is_authenticated or request.user.profileName.name not in ["SUPER-ADMIN", "ADMIN"]:
+        if not IsAdmin().has_permission(request, self):
             logger.warning(f"User {request.user.username if request.user.is_authenticated else 'anonymous'} denied permission to create notification")
             return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
         serializer = NotificationSerializer(data=request.data)
@@ -50,17 +55,20 @@ class NotificationListCreateView(APIView):
             errors=serializer.errors
         )
 
-class NotificationDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class NotificationDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request, notification_id):
         try:
             notification = Notification.objects.get(id=notification_id)
             if request.user.is_authenticated:
-                if request.user.profileName.name != "SUPER-ADMIN" and notification.receiver != request.user:
+                if not IsSuperAdmin().has_permission(request, self) and notification.receiver_id != request.user.pk:
                     logger.warning(f"User {request.user.username} denied access to notification {notification_id}")
                     return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+                not_modified = self.not_modified(request, instance_validators(request, notification))
+                if not_modified:
+                    return not_modified
                 serializer = NotificationSerializer(notification)
                 logger.info(f"Notification {notification_id} retrieved by {request.user.username}")
                 return api_response(data=serializer.data, message="Notification retrieved successfully")
@@ -76,7 +84,7 @@ class NotificationDetailView(APIView):
             if not request.user.is_authenticated:
                 logger.warning("Unauthenticated user attempted to update notification")
                 return api_response(message="Authentication required", status_code=status.HTTP_401_UNAUTHORIZED)
-            if request.user.profileName.name != "SUPER-ADMIN" and notification.receiver != request.user:
+            if not IsSuperAdmin().has_permission(request, self) and notification.receiver_id != request.user.pk:
                 logger.warning(f"User {request.user.username} denied permission to update notification {notification_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             serializer = NotificationSerializer(notification, data=request.data, partial=True)
@@ -91,7 +99,7 @@ class NotificationDetailView(APIView):
             return api_response(message="Notification not found", status_code=status.HTTP_404_NOT_FOUND)
 
     def delete(self, request, notification_id):
-        if not request.user.is_authenticated or request.user.profileName.name != "SUPER-ADMIN":
+        if not IsSuperAdmin().has_permission(request, self):
             logger.warning(f"User {request.user.username if request.user.is_authenticated else 'anonymous'} denied permission to delete notification")
             return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
         try:
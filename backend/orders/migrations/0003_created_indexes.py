@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_alter_case_id_alter_shoppingcart_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='case',
+            index=models.Index(fields=['createdDate', 'id'], name='case_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='shoppingcart',
+            index=models.Index(fields=['createdDate', 'id'], name='shoppingcart_created_idx'),
+        ),
+    ]
@@ -1,9 +1,10 @@
 from django.db import models
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from authentication.models import User
 
 class ShoppingCart(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("CRT"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("CRT"))
     userId = models.ForeignKey(User, on_delete=models.CASCADE, related_name='carts')
     createdDate = models.DateTimeField(auto_now_add=True)
     lastModifiedDate = models.DateTimeField(auto_now=True)
@@ -13,17 +14,22 @@ class ShoppingCart(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("CRT", ShoppingCart)
+            self.id = generate_unique_id("CRT")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Cart {self.id} for {self.userId.username}"
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'ShoppingCart'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='shoppingcart_created_idx'),
+        ]
 
 class Case(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("CAS"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("CAS"))
     accountId = models.ForeignKey(User, on_delete=models.CASCADE, related_name='cases')
     subject = models.CharField(max_length=255)
     description = models.TextField()
@@ -36,11 +42,16 @@ class Case(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("CAS", Case)
+            self.id = generate_unique_id("CAS")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"Case {self.id}: {self.subject}"
 
+    objects = AuditManager()
+
     class Meta:
-        db_table = 'Case'
\ No newline at end of file
+        db_table = 'Case'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='case_created_idx'),
+        ]
\ No newline at end of file
@@ -1,17 +1,18 @@
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import AllowAny
+from authentication.authentication import JWTAuthentication
 from authentication.permissions import IsUser, IsModerator, IsAdmin
 from orders.models import ShoppingCart, Case
 from orders.serializers import ShoppingCartSerializer, CaseSerializer
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
 from core.utils import api_response, paginate_queryset
 import logging
 
 logger = logging.getLogger('orders')
 
-class ShoppingCartListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ShoppingCartListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request):
@@ -22,19 +23,23 @@ class ShoppingCartListCreateView(APIView):
             carts = ShoppingCart.objects.filter(isActive=True)
         else:
             carts = ShoppingCart.objects.filter(userId=request.user, isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, carts))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(carts, request)
         serializer = ShoppingCartSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} shopping carts for {request.user.username}")
         return api_response(
             data={"shopping_carts": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Shopping carts retrieved successfully"
+            message="Shopping carts retrieved successfully",
+            request=request
         )
 
     def post(self, request):
         serializer = ShoppingCartSerializer(data=request.data)
         if serializer.is_valid():
             cart = serializer.save()
-            if cart.userId != request.user and not IsAdmin().has_permission(request, self):
+            if cart.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 cart.delete()
                 logger.warning(f"User {request.user.username} denied permission to create cart for another user")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
@@ -43,16 +48,19 @@ class ShoppingCartListCreateView(APIView):
         logger.error(f"ShoppingCart creation failed: {serializer.errors}")
         return api_response(message="Shopping cart creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class ShoppingCartDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ShoppingCartDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request, cart_id):
         try:
             cart = ShoppingCart.objects.get(id=cart_id, isActive=True)
-            if cart.userId != request.user and not IsAdmin().has_permission(request, self):
+            if cart.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied access to cart {cart_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            not_modified = self.not_modified(request, instance_validators(request, cart))
+            if not_modified:
+                return not_modified
             serializer = ShoppingCartSerializer(cart)
             logger.info(f"ShoppingCart {cart_id} retrieved by {request.user.username}")
             return api_response(data=serializer.data, message="Shopping cart retrieved successfully")
@@ -63,7 +71,7 @@ class ShoppingCartDetailView(APIView):
     def put(self, request, cart_id):
         try:
             cart = ShoppingCart.objects.get(id=cart_id)
-            if cart.userId != request.user and not IsAdmin().has_permission(request, self):
+            if cart.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to update cart {cart_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             serializer = ShoppingCartSerializer(cart, data=request.data, partial=True)
@@ -80,7 +88,7 @@ class ShoppingCartDetailView(APIView):
     def delete(self, request, cart_id):
         try:
             cart = ShoppingCart.objects.get(id=cart_id)
-            if cart.userId != request.user and not IsAdmin().has_permission(request, self):
+            if cart.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to delete cart {cart_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             cart.delete()
@@ -90,8 +98,8 @@ class ShoppingCartDetailView(APIView):
             logger.warning(f"ShoppingCart {cart_id} not found")
             return api_response(message="Shopping cart not found", status_code=status.HTTP_404_NOT_FOUND)
 
-class CaseListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class CaseListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request):
@@ -102,19 +110,23 @@ class CaseListCreateView(APIView):
             cases = Case.objects.filter(isActive=True)
         else:
             cases = Case.objects.filter(accountId=request.user, isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, cases))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(cases, request)
         serializer = CaseSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} cases for {request.user.username}")
         return api_response(
             data={"cases": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Cases retrieved successfully"
+            message="Cases retrieved successfully",
+            request=request
         )
 
     def post(self, request):
         serializer = CaseSerializer(data=request.data)
         if serializer.is_valid():
             case = serializer.save()
-            if case.accountId != request.user and not IsModerator().has_permission(request, self):
+            if case.accountId_id != request.user.pk and not IsModerator().has_permission(request, self):
                 case.delete()
                 logger.warning(f"User {request.user.username} denied permission to create case for another user")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
@@ -123,16 +135,19 @@ class CaseListCreateView(APIView):
         logger.error(f"Case creation failed: {serializer.errors}")
         return api_response(message="Case creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class CaseDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class CaseDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request, case_id):
         try:
             case = Case.objects.get(id=case_id, isActive=True)
-            if case.accountId != request.user and not IsModerator().has_permission(request, self):
+            if case.accountId_id != request.user.pk and not IsModerator().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied access to case {case_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            not_modified = self.not_modified(request, instance_validators(request, case))
+            if not_modified:
+                return not_modified
             serializer = CaseSerializer(case)
             logger.info(f"Case {case_id} retrieved by {request.user.username}")
             return api_response(data=serializer.data, message="Case retrieved successfully")
@@ -143,7 +158,7 @@ class CaseDetailView(APIView):
     def put(self, request, case_id):
         try:
             case = Case.objects.get(id=case_id)
-            if case.accountId != request.user and not IsModerator().has_permission(request, self):
+            if case.accountId_id != request.user.pk and not IsModerator().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to update case {case_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             serializer = CaseSerializer(case, data=request.data, partial=True)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0002_alter_bankcard_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bankcard',
+            index=models.Index(fields=['createdDate', 'id'], name='bankcard_created_idx'),
+        ),
+    ]
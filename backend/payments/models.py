@@ -1,10 +1,11 @@
 from django.db import models
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from authentication.models import User
 from django.contrib.auth.hashers import make_password
 
 class BankCard(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("CRD"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("CRD"))
     userId = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bank_cards')
     cardNumber = models.CharField(max_length=255)  # Will store hashed value
     expiryDate = models.CharField(max_length=5)    # MM/YY, not hashed
@@ -18,7 +19,7 @@ class BankCard(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("CRD", BankCard)
+            self.id = generate_unique_id("CRD")
         # Hash sensitive fields on save
         if self.cardNumber and not self.cardNumber.startswith('$2b$'):  # Check if already hashed
             self.cardNumber = make_password(self.cardNumber)
@@ -29,5 +30,10 @@ class BankCard(models.Model):
     def __str__(self):
         return f"Card for {self.userId.username}"
 
+    objects = AuditManager()
+
     class Meta:
-        db_table = 'BankCard'
\ No newline at end of file
+        db_table = 'BankCard'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='bankcard_created_idx'),
+        ]
\ No newline at end of file
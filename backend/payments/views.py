@@ -1,29 +1,33 @@
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
+from authentication.authentication import JWTAuthentication
 from authentication.permissions import IsUser
 from payments.models import BankCard
 from payments.serializers import BankCardSerializer
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
 from core.utils import api_response
 import logging
 
 logger = logging.getLogger('payments')
 
-class BankCardListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class BankCardListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request):
         cards = BankCard.objects.filter(userId=request.user, isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, cards))
+        if not_modified:
+            return not_modified
         serializer = BankCardSerializer(cards, many=True)
         logger.info(f"Retrieved {cards.count()} bank cards for {request.user.username}")
-        return api_response(data=serializer.data, message="Bank cards retrieved")
+        return api_response(data=serializer.data, message="Bank cards retrieved", request=request)
 
     def post(self, request):
         serializer = BankCardSerializer(data=request.data)
         if serializer.is_valid():
             card = serializer.save()
-            if card.userId != request.user:
+            if card.userId_id != request.user.pk:
                 card.delete()
                 logger.warning(f"User {request.user.username} denied permission")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
@@ -32,13 +36,16 @@ class BankCardListCreateView(APIView):
         logger.error(f"BankCard creation failed: {serializer.errors}")
         return api_response(message="Creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class BankCardDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class BankCardDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request, card_id):
         try:
             card = BankCard.objects.get(id=card_id, userId=request.user, isActive=True)
+            not_modified = self.not_modified(request, instance_validators(request, card))
+            if not_modified:
+                return not_modified
             serializer = BankCardSerializer(card)
             logger.info(f"BankCard {card_id} retrieved by {request.user.username}")
             return api_response(data=serializer.data, message="Bank card retrieved")
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0002_alter_pricebook_id_alter_product_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pricebook',
+            index=models.Index(fields=['createdDate', 'id'], name='pricebook_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['createdDate', 'id'], name='product_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productitem',
+            index=models.Index(fields=['createdDate', 'id'], name='productitem_created_idx'),
+        ),
+    ]
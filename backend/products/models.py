@@ -1,10 +1,11 @@
 from django.db import models
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from authentication.models import User
 from orders.models import ShoppingCart  # Forward reference, defined later
 
 class Product(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("PRD"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("PRD"))
     name = models.CharField(max_length=100)
     description = models.TextField()
     createdDate = models.DateTimeField(auto_now_add=True)
@@ -15,17 +16,22 @@ class Product(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("PRD", Product)
+            self.id = generate_unique_id("PRD")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'Product'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='product_created_idx'),
+        ]
 
 class PriceBook(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("PRC"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("PRC"))
     productId = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='price_books')
     price = models.DecimalField(max_digits=10, decimal_places=2)
     discount = models.DecimalField(max_digits=5, decimal_places=2, default=0.00)
@@ -37,17 +43,22 @@ class PriceBook(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("PRC", PriceBook)
+            self.id = generate_unique_id("PRC")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.productId.name} - ${self.price}"
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'PriceBook'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='pricebook_created_idx'),
+        ]
 
 class ProductItem(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("ITM"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("ITM"))
     productId = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='items')
     shoppingCartId = models.ForeignKey('orders.ShoppingCart', on_delete=models.CASCADE, related_name='items')
     quantity = models.PositiveIntegerField(default=1)
@@ -59,11 +70,16 @@ class ProductItem(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("ITM", ProductItem)
+            self.id = generate_unique_id("ITM")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.productId.name} (x{self.quantity}) in Cart {self.shoppingCartId.id}"
 
+    objects = AuditManager()
+
     class Meta:
-        db_table = 'ProductItem'
\ No newline at end of file
+        db_table = 'ProductItem'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='productitem_created_idx'),
+        ]
\ No newline at end of file
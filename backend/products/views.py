@@ -1,27 +1,34 @@
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import AllowAny
+from authentication.authentication import JWTAuthentication
 from authentication.permissions import IsAdmin, IsUser
 from products.models import Product, PriceBook, ProductItem
 from products.serializers import ProductSerializer, PriceBookSerializer, ProductItemSerializer
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
+from core.response_cache import cache_response
 from core.utils import api_response, paginate_queryset
 import logging
 
 logger = logging.getLogger('products')
 
-class ProductListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ProductListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
+    @cache_response(Product)
     def get(self, request):
         products = Product.objects.filter(isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, products))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(products, request)
         serializer = ProductSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} products")
         return api_response(
             data={"products": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Products retrieved successfully"
+            message="Products retrieved successfully",
+            request=request
         )
 
     def post(self, request):
@@ -36,13 +43,16 @@ class ProductListCreateView(APIView):
         logger.error(f"Product creation failed: {serializer.errors}")
         return api_response(message="Product creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class ProductDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ProductDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request, product_id):
         try:
             product = Product.objects.get(id=product_id, isActive=True)
+            not_modified = self.not_modified(request, instance_validators(request, product))
+            if not_modified:
+                return not_modified
             serializer = ProductSerializer(product)
             logger.info(f"Product {product_id} retrieved")
             return api_response(data=serializer.data, message="Product retrieved successfully")
@@ -80,18 +90,23 @@ class ProductDetailView(APIView):
             logger.warning(f"Product {product_id} not found")
             return api_response(message="Product not found", status_code=status.HTTP_404_NOT_FOUND)
 
-class PriceBookListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class PriceBookListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
+    @cache_response(PriceBook)
     def get(self, request):
         pricebooks = PriceBook.objects.filter(isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, pricebooks))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(pricebooks, request)
         serializer = PriceBookSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} pricebooks")
         return api_response(
             data={"pricebooks": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="PriceBooks retrieved successfully"
+            message="PriceBooks retrieved successfully",
+            request=request
         )
 
     def post(self, request):
@@ -106,13 +121,16 @@ class PriceBookListCreateView(APIView):
         logger.error(f"PriceBook creation failed: {serializer.errors}")
         return api_response(message="PriceBook creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class PriceBookDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class PriceBookDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request, pricebook_id):
         try:
             pricebook = PriceBook.objects.get(id=pricebook_id, isActive=True)
+            not_modified = self.not_modified(request, instance_validators(request, pricebook))
+            if not_modified:
+                return not_modified
             serializer = PriceBookSerializer(pricebook)
             logger.info(f"PriceBook {pricebook_id} retrieved")
             return api_response(data=serializer.data, message="PriceBook retrieved successfully")
@@ -150,8 +168,8 @@ class PriceBookDetailView(APIView):
             logger.warning(f"PriceBook {pricebook_id} not found")
             return api_response(message="PriceBook not found", status_code=status.HTTP_404_NOT_FOUND)
 
-class ProductItemListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ProductItemListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request):
@@ -159,19 +177,23 @@ class ProductItemListCreateView(APIView):
             logger.warning("Unauthenticated user attempted to access product items")
             return api_response(message="Authentication required", status_code=status.HTTP_401_UNAUTHORIZED)
         product_items = ProductItem.objects.filter(shoppingCartId__userId=request.user, isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, product_items))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(product_items, request)
         serializer = ProductItemSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} product items for {request.user.username}")
         return api_response(
             data={"product_items": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Product items retrieved successfully"
+            message="Product items retrieved successfully",
+            request=request
         )
 
     def post(self, request):
         serializer = ProductItemSerializer(data=request.data)
         if serializer.is_valid():
             product_item = serializer.save()
-            if product_item.shoppingCartId.userId != request.user and not IsAdmin().has_permission(request, self):
+            if product_item.shoppingCartId.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 product_item.delete()
                 logger.warning(f"User {request.user.username} denied permission to add to cart {product_item.shoppingCartId.id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
@@ -180,16 +202,19 @@ class ProductItemListCreateView(APIView):
         logger.error(f"ProductItem creation failed: {serializer.errors}")
         return api_response(message="Product item creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class ProductItemDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class ProductItemDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request, productitem_id):
         try:
-            product_item = ProductItem.objects.get(id=productitem_id, isActive=True)
-            if product_item.shoppingCartId.userId != request.user and not IsAdmin().has_permission(request, self):
+            product_item = ProductItem.objects.select_related('shoppingCartId').get(id=productitem_id, isActive=True)
+            if product_item.shoppingCartId.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied access to product item {productitem_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            not_modified = self.not_modified(request, instance_validators(request, product_item))
+            if not_modified:
+                return not_modified
             serializer = ProductItemSerializer(product_item)
             logger.info(f"ProductItem {productitem_id} retrieved by {request.user.username}")
             return api_response(data=serializer.data, message="Product item retrieved successfully")
@@ -199,8 +224,8 @@ class ProductItemDetailView(APIView):
 
     def put(self, request, productitem_id):
         try:
-            product_item = ProductItem.objects.get(id=productitem_id)
-            if product_item.shoppingCartId.userId != request.user and not IsAdmin().has_permission(request, self):
+            product_item = ProductItem.objects.select_related('shoppingCartId').get(id=productitem_id)
+            if product_item.shoppingCartId.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to update product item {productitem_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             serializer = ProductItemSerializer(product_item, data=request.data, partial=True)
@@ -216,8 +241,8 @@ class ProductItemDetailView(APIView):
 
     def delete(self, request, productitem_id):
         try:
-            product_item = ProductItem.objects.get(id=productitem_id)
-            if product_item.shoppingCartId.userId != request.user and not IsAdmin().has_permission(request, self):
+            product_item = ProductItem.objects.select_related('shoppingCartId').get(id=productitem_id)
+            if product_item.shoppingCartId.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to delete product item {productitem_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             product_item.delete()
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.20 on 2026-10-18 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('records', '0002_alter_address_id_alter_recordtype_id'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='address',
+            index=models.Index(fields=['createdDate', 'id'], name='address_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recordtype',
+            index=models.Index(fields=['createdDate', 'id'], name='recordtype_created_idx'),
+        ),
+    ]
@@ -1,9 +1,10 @@
 from django.db import models
-from core.utils import generate_unique_id
+from core.managers import AuditManager
+from core.utils import generate_unique_id, unique_id_default
 from authentication.models import User
 
 class RecordType(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("RTY"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("RTY"))
     name = models.CharField(max_length=100)
     description = models.TextField(blank=True)
     createdDate = models.DateTimeField(auto_now_add=True)
@@ -14,17 +15,22 @@ class RecordType(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("RTY", RecordType)
+            self.id = generate_unique_id("RTY")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return self.name
 
+    objects = AuditManager()
+
     class Meta:
         db_table = 'RecordType'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='recordtype_created_idx'),
+        ]
 
 class Address(models.Model):
-    id = models.CharField(max_length=20, primary_key=True, default=generate_unique_id("ADR"))
+    id = models.CharField(max_length=20, primary_key=True, default=unique_id_default("ADR"))
     userId = models.ForeignKey(User, on_delete=models.CASCADE, related_name='addresses')
     street = models.CharField(max_length=255)
     city = models.CharField(max_length=100)
@@ -39,11 +45,16 @@ class Address(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.id:
-            self.id = generate_unique_id("ADR", Address)
+            self.id = generate_unique_id("ADR")
         super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.street}, {self.city}, {self.country}"
 
+    objects = AuditManager()
+
     class Meta:
-        db_table = 'Address'
\ No newline at end of file
+        db_table = 'Address'
+        indexes = [
+            models.Index(fields=['createdDate', 'id'], name='address_created_idx'),
+        ]
\ No newline at end of file
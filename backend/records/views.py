@@ -1,27 +1,34 @@
 from rest_framework.views import APIView
 from rest_framework import status
-from rest_framework.authentication import TokenAuthentication
 from rest_framework.permissions import AllowAny
+from authentication.authentication import JWTAuthentication
 from authentication.permissions import IsUser, IsAdmin
 from records.models import RecordType, Address
 from records.serializers import RecordTypeSerializer, AddressSerializer
+from core.conditional import ConditionalMixin, queryset_validators, instance_validators
+from core.response_cache import cache_response
 from core.utils import api_response, paginate_queryset
 import logging
 
 logger = logging.getLogger('records')
 
-class RecordTypeListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class RecordTypeListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
+    @cache_response(RecordType)
     def get(self, request):
         record_types = RecordType.objects.filter(isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, record_types))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(record_types, request)
         serializer = RecordTypeSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} record types")
         return api_response(
             data={"record_types": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Record types retrieved successfully"
+            message="Record types retrieved successfully",
+            request=request
         )
 
     def post(self, request):
@@ -36,13 +43,16 @@ class RecordTypeListCreateView(APIView):
         logger.error(f"RecordType creation failed: {serializer.errors}")
         return api_response(message="Record type creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class RecordTypeDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class RecordTypeDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [AllowAny]
 
     def get(self, request, recordtype_id):
         try:
             record_type = RecordType.objects.get(id=recordtype_id, isActive=True)
+            not_modified = self.not_modified(request, instance_validators(request, record_type))
+            if not_modified:
+                return not_modified
             serializer = RecordTypeSerializer(record_type)
             logger.info(f"RecordType {recordtype_id} retrieved")
             return api_response(data=serializer.data, message="Record type retrieved successfully")
@@ -80,8 +90,8 @@ class RecordTypeDetailView(APIView):
             logger.warning(f"RecordType {recordtype_id} not found")
             return api_response(message="Record type not found", status_code=status.HTTP_404_NOT_FOUND)
 
-class AddressListCreateView(APIView):
-    authentication_classes = [TokenAuthentication]
+class AddressListCreateView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request):
@@ -92,19 +102,23 @@ class AddressListCreateView(APIView):
             addresses = Address.objects.filter(isActive=True)
         else:
             addresses = Address.objects.filter(userId=request.user, isActive=True)
+        not_modified = self.not_modified(request, queryset_validators(request, addresses))
+        if not_modified:
+            return not_modified
         paginated_data = paginate_queryset(addresses, request)
         serializer = AddressSerializer(paginated_data['results'], many=True)
         logger.info(f"Retrieved {paginated_data['count']} addresses for {request.user.username}")
         return api_response(
             data={"addresses": serializer.data, "count": paginated_data['count'], "next": paginated_data['next'], "previous": paginated_data['previous']},
-            message="Addresses retrieved successfully"
+            message="Addresses retrieved successfully",
+            request=request
         )
 
     def post(self, request):
         serializer = AddressSerializer(data=request.data)
         if serializer.is_valid():
             address = serializer.save()
-            if address.userId != request.user and not IsAdmin().has_permission(request, self):
+            if address.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 address.delete()
                 logger.warning(f"User {request.user.username} denied permission to create address for another user")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
@@ -113,16 +127,19 @@ class AddressListCreateView(APIView):
         logger.error(f"Address creation failed: {serializer.errors}")
         return api_response(message="Address creation failed", status_code=status.HTTP_400_BAD_REQUEST, errors=serializer.errors)
 
-class AddressDetailView(APIView):
-    authentication_classes = [TokenAuthentication]
+class AddressDetailView(ConditionalMixin, APIView):
+    authentication_classes = [JWTAuthentication]
     permission_classes = [IsUser]
 
     def get(self, request, address_id):
         try:
             address = Address.objects.get(id=address_id, isActive=True)
-            if address.userId != request.user and not IsAdmin().has_permission(request, self):
+            if address.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied access to address {address_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
+            not_modified = self.not_modified(request, instance_validators(request, address))
+            if not_modified:
+                return not_modified
             serializer = AddressSerializer(address)
             logger.info(f"Address {address_id} retrieved by {request.user.username}")
             return api_response(data=serializer.data, message="Address retrieved successfully")
@@ -133,7 +150,7 @@ class AddressDetailView(APIView):
     def put(self, request, address_id):
         try:
             address = Address.objects.get(id=address_id)
-            if address.userId != request.user and not IsAdmin().has_permission(request, self):
+            if address.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to update address {address_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             serializer = AddressSerializer(address, data=request.data, partial=True)
@@ -150,7 +167,7 @@ class AddressDetailView(APIView):
     def delete(self, request, address_id):
         try:
             address = Address.objects.get(id=address_id)
-            if address.userId != request.user and not IsAdmin().has_permission(request, self):
+            if address.userId_id != request.user.pk and not IsAdmin().has_permission(request, self):
                 logger.warning(f"User {request.user.username} denied permission to delete address {address_id}")
                 return api_response(message="Permission denied", status_code=status.HTTP_403_FORBIDDEN)
             address.delete()